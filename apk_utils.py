@@ -0,0 +1,34 @@
+"""
+Helpers for inspecting a built extension APK. Each APK is opened once and
+the raw and decoded manifest are memoized, so callers can share them freely.
+"""
+import functools
+import zipfile
+from pathlib import Path
+
+DEFAULT_APK = Path('artifacts/en-manhwaread/src/en/manhwaread/build/outputs/apk/release/tachiyomi-en.manhwaread-v1.4.2-release.apk')
+
+
+@functools.lru_cache(maxsize=None)
+def open_apk(path: Path) -> zipfile.ZipFile:
+    """Open the APK once; the central directory is read a single time."""
+    return zipfile.ZipFile(path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_manifest_bytes(path: Path) -> bytes:
+    """Raw binary AndroidManifest.xml."""
+    return open_apk(path).read('AndroidManifest.xml')
+
+
+@functools.lru_cache(maxsize=None)
+def get_manifest_xml(path: Path) -> str:
+    """Decoded AndroidManifest.xml (requires androguard)."""
+    from androguard.core.axml import AXMLPrinter
+    return AXMLPrinter(get_manifest_bytes(path)).get_xml().decode('utf-8')
+
+
+def get_entry_size(path: Path, name: str = 'classes.dex') -> int:
+    """Uncompressed size of an entry, read from the central directory (no decompression)."""
+    return open_apk(path).getinfo(name).file_size
+
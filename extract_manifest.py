@@ -1,6 +1,2 @@
-import zipfile
-from pathlib import Path
-apk = Path('artifacts/en-manhwaread/src/en/manhwaread/build/outputs/apk/release/tachiyomi-en.manhwaread-v1.4.2-release.apk')
-with zipfile.ZipFile(apk) as z:
-    manifest = z.read('AndroidManifest.xml')
-print(len(manifest))
+from apk_utils import DEFAULT_APK, get_manifest_bytes
+print(len(get_manifest_bytes(DEFAULT_APK)))
@@ -1,6 +1,2 @@
-import zipfile
-from pathlib import Path
-apk = Path('artifacts/en-manhwaread/src/en/manhwaread/build/outputs/apk/release/tachiyomi-en.manhwaread-v1.4.2-release.apk')
-with zipfile.ZipFile(apk) as z:
-    dex_data = z.read('classes.dex')
-print(len(dex_data))
+from apk_utils import DEFAULT_APK, get_entry_size
+print(get_entry_size(DEFAULT_APK, 'classes.dex'))
@@ -3,27 +3,34 @@
 Manhwa Scraper - Downloads all chapters and images from manhwa series
 """
 
+import functools
+import itertools
 import signal
 import sys
 import json
 import os
 import re
+import shutil
+import threading
 import time
 import requests
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, SoupStrainer
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(levelname)s - [%(threadName)s] %(message)s',
     handlers=[
         logging.FileHandler('manhwa_scraper.log'),
         logging.StreamHandler()
@@ -31,8 +38,170 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared across calls
+_CHAPTER_HREF_RE = re.compile(r'/manhwa/[^/]+/chapter-')
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+)')
+# Only build chapter links when parsing a series page
+_CHAPTER_STRAINER = SoupStrainer('a', href=_CHAPTER_HREF_RE)
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+# Quoted image URLs in script bodies. Keyed forms (url: "...", src: "...") are
+# plain string literals too, so one literal pattern covers them all.
+_IMG_URL_RE = re.compile(r'(?i)["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif)[^"\']*)["\']')
+# Image extension anywhere in a URL (query strings allowed)
+_IMAGE_EXT_RE = re.compile(r'(?i)\.(?:jpe?g|png|webp|gif)')
+# Bare absolute image URLs (attribute values, CSS text)
+_ABS_IMG_URL_RE = re.compile(r'(?i)https?://[^\s<>"\'{}|\\^`\[\]]*\.(?:jpg|jpeg|png|webp|gif)')
+# background / background-image declarations in inline styles
+_BG_URL_RE = re.compile(r'(?i)background(?:-image)?\s*:\s*[^;]*url\(["\']?([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']?\)')
+
+# Status codes from CDNs that reject HEAD but serve GET
+_HEAD_BLOCKED_STATUSES = (403, 405, 501)
+# Written into a chapter dir (holding the page count) once every page is saved
+_COMPLETE_MARKER = '.complete'
+
+def _make_soup(markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with lxml (C-backed, much faster), falling back to html.parser if lxml is missing."""
+    try:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
+
+def _is_image_url(url: str) -> bool:
+    """Check if URL is a valid image URL"""
+    if not url or not isinstance(url, str):
+        return False
+
+    # Must be HTTP/HTTPS (this also rules out blob: and data: URLs)
+    if url.startswith('https://'):
+        host_start = 8
+    elif url.startswith('http://'):
+        host_start = 7
+    else:
+        return False
+
+    # Relax domain filtering: accept any http(s) domain to avoid missing valid CDNs,
+    # but there must be a host between the scheme and the path
+    if len(url) <= host_start or url[host_start] in '/?#':
+        return False
+
+    # Must have image extension (one case-insensitive scan)
+    return _IMAGE_EXT_RE.search(url) is not None
+
+# Page parsers below are plain functions over markup so they can run in a
+# worker process (see ManhwaScraper._parse); they return picklable results.
+
+def _parse_chapter_links(markup, base_url: str) -> List[Dict[str, str]]:
+    """Chapter dicts from a series page, deduped by URL and sorted by number."""
+    # Only chapter links are needed, so skip building the rest of the page
+    soup = _make_soup(markup, _CHAPTER_STRAINER)
+
+    chapters = []
+    chapter_links = soup.find_all('a')
+
+    for link in chapter_links:
+        href = link.get('href')
+        if href:
+            # Extract chapter number from URL
+            chapter_match = _CHAPTER_NUM_RE.search(href)
+            if chapter_match:
+                chapter_num = chapter_match.group(1)
+                chapter_title = link.get_text(strip=True)
+                if not chapter_title:
+                    chapter_title = f"Chapter {chapter_num}"
+
+                full_url = urljoin(base_url, href)
+                chapters.append({
+                    'number': chapter_num,
+                    'title': chapter_title,
+                    'url': full_url
+                })
+
+    # Remove duplicates (first occurrence wins) and sort by chapter number
+    by_url: Dict[str, Dict[str, str]] = {}
+    for chapter in sorted(chapters, key=lambda x: int(x['number'])):
+        by_url.setdefault(chapter['url'], chapter)
+    return list(by_url.values())
+
+def _scan_chapter_images(markup, base_url: str) -> List[str]:
+    """Candidate image URLs from a chapter page, <img> tags first, in page order."""
+    soup = _make_soup(markup)
+
+    # Walk the tree once (elements and text nodes), collecting candidates per
+    # source so that <img> tags keep priority over script and style URLs in
+    # page order. Dicts double as insertion-ordered sets for O(1) dedupe.
+    img_urls: Dict[str, None] = {}
+    script_urls: Dict[str, None] = {}
+    attr_urls: Dict[str, None] = {}
+    style_urls: Dict[str, None] = {}
+    for el in soup.descendants:
+        if isinstance(el, NavigableString):
+            # Bare absolute image URLs in text nodes; script and style bodies
+            # are scanned with their element below
+            if 'http' in el and (el.parent is None or el.parent.name not in ('script', 'style')):
+                for url in _ABS_IMG_URL_RE.findall(el):
+                    if _is_image_url(url):
+                        attr_urls[url] = None
+            continue
+        if el.name == 'img':
+            # Method 1: img tags with various lazy-load attributes
+            for attr in ['data-src', 'data-original', 'data-lazy-src', 'data-url', 'src']:
+                src = el.get(attr)
+                if not src:
+                    continue
+                # Lazy loaders often use site-relative paths
+                src = urljoin(base_url, src)
+                if _is_image_url(src):
+                    img_urls[src] = None
+                    break
+        elif el.name == 'script':
+            # Method 2: script tags that might contain image URLs
+            script_text = el.string or ''
+            # Skip scripts without any image extension (analytics, widgets, ...)
+            if script_text and _IMAGE_EXT_RE.search(script_text):
+                for m in _IMG_URL_RE.finditer(script_text):
+                    url = m.group(1)
+                    if not url.startswith('http'):
+                        url = urljoin(base_url, url)
+                    if _is_image_url(url):
+                        script_urls[url] = None
+                # Unquoted absolute URLs too (comments, concatenated strings)
+                for url in _ABS_IMG_URL_RE.findall(script_text):
+                    if _is_image_url(url):
+                        script_urls[url] = None
+        elif el.name == 'style':
+            # Absolute image URLs in <style> blocks
+            for url in _ABS_IMG_URL_RE.findall(el.string or ''):
+                if _is_image_url(url):
+                    attr_urls[url] = None
+
+        # Method 3: image URLs in attribute values, scanned per node instead of
+        # re-serializing the whole soup: absolute URLs anywhere (data-bg, href,
+        # placeholder src, ...) and site-relative ones in *src attributes
+        for name, value in el.attrs.items():
+            if not isinstance(value, str):
+                continue
+            if 'http' in value:
+                for url in _ABS_IMG_URL_RE.findall(value):
+                    if _is_image_url(url):
+                        attr_urls[url] = None
+            elif name.endswith('src') and _IMAGE_EXT_RE.search(value):
+                url = urljoin(base_url, value)
+                if _is_image_url(url):
+                    attr_urls[url] = None
+
+        # Method 4: background images in inline styles
+        style = el.get('style')
+        if style and 'url(' in style:
+            for url in _BG_URL_RE.findall(style):
+                if not url.startswith('http'):
+                    url = urljoin(base_url, url)
+                if _is_image_url(url):
+                    style_urls[url] = None
+
+    return list({**img_urls, **script_urls, **attr_urls, **style_urls})
+
 class ManhwaScraper:
-    def __init__(self, base_url: str = "https://manhwaread.com", download_dir: str = "downloads", use_playwright: bool = False, playwright_wait: float = 3.0, validate_urls: bool = False, max_workers: int = 6):
+    def __init__(self, base_url: str = "https://manhwaread.com", download_dir: str = "downloads", use_playwright: bool = False, playwright_wait: float = 3.0, validate_urls: bool = False, max_workers: int = 6, chapter_workers: int = 3, use_http2: bool = False, guess_image_urls: bool = False, async_io: bool = False, async_concurrency: int = 20, parse_processes: int = 0):
         self.base_url = base_url
         self.download_dir = Path(download_dir)
         self.session = requests.Session()
@@ -55,9 +224,32 @@ class ManhwaScraper:
         self.playwright_wait = max(playwright_wait, 0.0)
         self.validate_urls = validate_urls
         self.max_workers = max(1, int(max_workers))
+        self.chapter_workers = max(1, int(chapter_workers))
+        self.guess_image_urls = guess_image_urls
+        self.async_io = async_io
+        self.async_concurrency = max(1, int(async_concurrency))
+        # One long-lived pool for validation and image downloads, sized so every
+        # concurrent chapter of every concurrent title can still run max_workers
+        # requests (download_all sets title_workers)
+        self.title_workers = 1
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Optional process pool so HTML parsing is not serialized on the GIL
+        self.parse_processes = max(0, int(parse_processes))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        # Hosts that answered HEAD with 403/405/501; probed with GET instead
+        self._head_blocked_hosts: Set[str] = set()
         self.playwright = None
         self.playwright_browser = None
         self.playwright_context = None
+        # Single reused page; the sync API is not thread-safe, so page use is serialized
+        self._pw_page = None
+        self._pw_lock = threading.Lock()
+        self.http2_client = None
+        # Per-instance LRU of recently fetched page HTML
+        self._fetch_html_cached = functools.lru_cache(maxsize=64)(self._fetch_html)
+        if use_http2:
+            self._init_http2_client()
 
     def signal_handler(self, signum, frame):
         """Handle interrupt signal"""
@@ -66,7 +258,7 @@ class ManhwaScraper:
 
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to be safe for filesystem"""
-        return re.sub(r'[<>:"/\\|?*]', '_', filename)
+        return _SANITIZE_RE.sub('_', filename)
 
     def create_directory(self, path: Path) -> None:
         """Create directory if it doesn't exist"""
@@ -102,10 +294,29 @@ class ManhwaScraper:
             self.playwright = sync_playwright().start()
             self.playwright_browser = self.playwright.chromium.launch(headless=True)
             self.playwright_context = self.playwright_browser.new_context(user_agent=self.session.headers.get('User-Agent'))
+            self._pw_page = self.playwright_context.new_page()
         except Exception as e:
             logger.warning(f"Failed to initialize Playwright, falling back to requests only: {e}")
             self.use_playwright = False
 
+    def _init_http2_client(self) -> None:
+        """Create an httpx HTTP/2 client so image requests share multiplexed connections."""
+        try:
+            import httpx
+            limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+            self.http2_client = httpx.Client(
+                http2=True,
+                headers=dict(self.session.headers),
+                # Share the requests cookie jar so Playwright-synced cookies apply to both clients
+                cookies=self.session.cookies,
+                transport=httpx.HTTPTransport(http2=True, retries=3, limits=limits),
+                timeout=httpx.Timeout(15.0),
+                follow_redirects=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to initialize HTTP/2 client (pip install 'httpx[http2]'), using requests only: {e}")
+            self.http2_client = None
+
     def _sync_cookies_from_playwright(self, url: Optional[str] = None) -> None:
         """Copy cookies from Playwright context into requests Session to satisfy CDNs that require tokens."""
         if not self.playwright_context:
@@ -127,6 +338,8 @@ class ManhwaScraper:
 
     def _close_playwright(self) -> None:
         try:
+            if self._pw_page is not None:
+                self._pw_page.close()
             if self.playwright_context is not None:
                 self.playwright_context.close()
             if self.playwright_browser is not None:
@@ -139,160 +352,167 @@ class ManhwaScraper:
             self.playwright = None
             self.playwright_browser = None
             self.playwright_context = None
+            self._pw_page = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Lazily create the shared worker pool."""
+        with self._pool_lock:
+            if self._pool is None:
+                size = self.max_workers * self.chapter_workers * self.title_workers
+                self._pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix='mw')
+            return self._pool
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the parser process pool (None when parsing inline)."""
+        if self.parse_processes <= 0:
+            return None
+        with self._pool_lock:
+            if self._parse_pool is None:
+                # spawn: forking a process that already runs worker threads is unsafe
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=multiprocessing.get_context('spawn'))
+            return self._parse_pool
+
+    def _run_bounded(self, fn: Callable, items: Iterable, limit: int) -> Iterator:
+        """Run fn over items on the shared pool with at most `limit` tasks in flight,
+        yielding results as they complete. Closing the generator cancels queued work.
+        """
+        pool = self._get_pool()
+        items = iter(items)
+        pending = {pool.submit(fn, item) for item in itertools.islice(items, limit)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    for item in itertools.islice(items, 1):
+                        pending.add(pool.submit(fn, item))
+                    yield fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
 
-    def get_soup(self, url: str) -> BeautifulSoup:
-        """Get BeautifulSoup object from URL (Playwright fallback if enabled)."""
+    def close(self) -> None:
+        """Release Playwright, HTTP/2 client, worker pool and cached pages."""
+        self._close_playwright()
+        self._fetch_html_cached.cache_clear()
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+        if self.http2_client is not None:
+            try:
+                self.http2_client.close()
+            except Exception:
+                pass
+            self.http2_client = None
+
+    def _fetch_with_http2(self, url: str) -> Optional[bytes]:
+        """Fetch a page over the HTTP/2 client; returns None so callers can fall back to requests."""
+        try:
+            response = self.http2_client.get(url, timeout=30, headers={'Referer': self.base_url})
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            logger.debug(f"HTTP/2 fetch failed for {url}: {e}")
+            return None
+
+    def _fetch_html(self, url: str):
+        """Fetch page HTML (Playwright-rendered str if enabled, else raw bytes).
+        Raises requests.RequestException on failure so errors are never memoized.
+        """
         # Try Playwright rendering for dynamic pages
         if self.use_playwright:
             try:
                 self._init_playwright()
                 if self.playwright_context is not None:
-                    page = self.playwright_context.new_page()
-                    page.goto(url, wait_until='load', timeout=45000)
-                    if self.playwright_wait > 0:
-                        time.sleep(self.playwright_wait)
-                    html = page.content()
-                    page.close()
+                    with self._pw_lock:
+                        # Reuse one page instead of paying page/JS-context setup per URL
+                        if self._pw_page is None or self._pw_page.is_closed():
+                            self._pw_page = self.playwright_context.new_page()
+                        self._pw_page.goto(url, wait_until='load', timeout=45000)
+                        if self.playwright_wait > 0:
+                            time.sleep(self.playwright_wait)
+                        html = self._pw_page.content()
                     # Sync cookies from Playwright to requests for subsequent image downloads
                     self._sync_cookies_from_playwright(url)
-                    return BeautifulSoup(html, 'html.parser')
+                    return html
             except Exception as e:
                 logger.warning(f"Playwright fetch failed for {url}, falling back to requests: {e}")
 
-        # Fallback to requests
+        # Fallback to HTTP, over the HTTP/2 client when enabled
+        if self.http2_client is not None:
+            html = self._fetch_with_http2(url)
+            if html is not None:
+                return html
+        response = self.session.get(url, timeout=30, headers={'Referer': self.base_url})
+        response.raise_for_status()
+        # Keep raw bytes so lxml handles encoding detection in C
+        return response.content
+
+    def _get_html(self, url: str):
+        """Memoized page HTML, or None (logged) if it could not be fetched."""
         try:
-            response = self.session.get(url, timeout=30, headers={'Referer': self.base_url})
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return self._fetch_html_cached(url)
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Get BeautifulSoup object from URL (Playwright fallback if enabled).
+        parse_only restricts tree building to matching elements. Page HTML is
+        memoized, so re-parsing a page (e.g. on retries) does not re-download it.
+        """
+        html = self._get_html(url)
+        if html is None:
+            return None
+        return _make_soup(html, parse_only)
+
+    def _parse(self, parser: Callable, html, *args):
+        """Run a module-level page parser, in a worker process when parse_processes is set."""
+        pool = self._get_parse_pool()
+        if pool is None:
+            return parser(html, *args)
+        try:
+            return pool.submit(parser, html, *args).result()
+        except BrokenProcessPool as e:
+            # A worker died (OOM, killed); stop using the pool rather than
+            # failing every later page
+            logger.warning(f"Parser process pool broke, parsing in-thread from now on: {e}")
+            with self._pool_lock:
+                if self._parse_pool is pool:
+                    self._parse_pool = None
+                    self.parse_processes = 0
+            pool.shutdown(wait=False)
+            return parser(html, *args)
+
     def extract_chapters(self, manhwa_url: str) -> List[Dict[str, str]]:
         """Extract all chapters from a manhwa page"""
-        soup = self.get_soup(manhwa_url)
-        if not soup:
+        html = self._get_html(manhwa_url)
+        if html is None:
             return []
 
-        chapters = []
-        # Look for chapter links
-        chapter_links = soup.find_all('a', href=re.compile(r'/manhwa/[^/]+/chapter-'))
-
-        for link in chapter_links:
-            href = link.get('href')
-            if href:
-                # Extract chapter number from URL
-                chapter_match = re.search(r'chapter-(\d+)', href)
-                if chapter_match:
-                    chapter_num = chapter_match.group(1)
-                    chapter_title = link.get_text(strip=True)
-                    if not chapter_title:
-                        chapter_title = f"Chapter {chapter_num}"
-
-                    full_url = urljoin(self.base_url, href)
-                    chapters.append({
-                        'number': chapter_num,
-                        'title': chapter_title,
-                        'url': full_url
-                    })
-
-        # Remove duplicates and sort by chapter number
-        seen = set()
-        unique_chapters = []
-        for chapter in sorted(chapters, key=lambda x: int(x['number'])):
-            if chapter['url'] not in seen:
-                seen.add(chapter['url'])
-                unique_chapters.append(chapter)
-
+        unique_chapters = self._parse(_parse_chapter_links, html, self.base_url)
         logger.info(f"Found {len(unique_chapters)} chapters")
         return unique_chapters
 
     def extract_images_from_chapter(self, chapter_url: str) -> List[str]:
         """Extract image URLs from a chapter page"""
-        soup = self.get_soup(chapter_url)
-        if not soup:
+        html = self._get_html(chapter_url)
+        if html is None:
             return []
 
-        images = []
+        images: Dict[str, None] = dict.fromkeys(self._parse(_scan_chapter_images, html, self.base_url))
 
-        # Method 1: Look for img tags with various attributes
-        img_tags = soup.find_all('img')
-        for img in img_tags:
-            # Try different attributes for image sources
-            for attr in ['data-src', 'data-original', 'data-lazy-src', 'data-url', 'src']:
-                src = img.get(attr)
-                if src and self._is_valid_image_url(src):
-                    if src not in images:
-                        images.append(src)
-                        break
+        # Method 4: Guess image URLs from common hosting patterns. This yields mostly
+        # 404s, so it is opt-in and only tried when the page itself had no images.
+        if not images and self.guess_image_urls:
+            for url in self._guess_image_urls(chapter_url):
+                images.setdefault(url, None)
 
-        # Method 2: Look for script tags that might contain image URLs
-        scripts = soup.find_all('script')
-        for script in scripts:
-            script_text = script.string or ''
-            if script_text:
-                # Look for image URLs in script content with various patterns
-                patterns = [
-                    r'["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']',
-                    r'["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif)[^"\']*)["\']',
-                    r'url["\']?\s*:\s*["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']',
-                    r'src["\']?\s*:\s*["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']'
-                ]
-
-                for pattern in patterns:
-                    img_urls = re.findall(pattern, script_text, re.IGNORECASE)
-                    for url in img_urls:
-                        if not url.startswith('http'):
-                            url = urljoin(self.base_url, url)
-                        if self._is_valid_image_url(url) and url not in images:
-                            images.append(url)
-
-        # Method 3: Look for common image hosting patterns and data attributes
-        page_text = str(soup)
-        # Look for image URLs in the page content with broader patterns
-        img_patterns = [
-            r'https?://[^\s<>"{}|\\^`\[\]]*\.(?:jpg|jpeg|png|webp|gif)',
-            r'data-[a-zA-Z0-9-]*["\']?\s*:\s*["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']',
-            r'src["\']?\s*=\s*["\']([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']'
-        ]
-
-        for pattern in img_patterns:
-            found_urls = re.findall(pattern, page_text, re.IGNORECASE)
-            for url in found_urls:
-                if not url.startswith('http'):
-                    url = urljoin(self.base_url, url)
-                if self._is_valid_image_url(url) and url not in images:
-                    images.append(url)
-
-        # Method 4: Try to find images by examining div containers that might hold chapters
-        chapter_containers = soup.find_all(['div', 'section', 'article'], class_=re.compile(r'(chapter|content|page|image|img)', re.IGNORECASE))
-        for container in chapter_containers:
-            # Look for background images in styles
-            style = container.get('style', '')
-            bg_patterns = [
-                r'background-image\s*:\s*url\(["\']?([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']?\)',
-                r'background\s*:\s*[^;]*url\(["\']?([^"\']*\.(?:jpg|jpeg|png|webp|gif))["\']?\)'
-            ]
-
-            for pattern in bg_patterns:
-                bg_urls = re.findall(pattern, style, re.IGNORECASE)
-                for url in bg_urls:
-                    if not url.startswith('http'):
-                        url = urljoin(self.base_url, url)
-                    if self._is_valid_image_url(url) and url not in images:
-                        images.append(url)
-
-        # Method 5: Try to construct image URLs based on common patterns
-        constructed_images = self._construct_image_urls(chapter_url)
-        for url in constructed_images:
-            if url not in images:
-                images.append(url)
-
-        # Remove duplicates and filter out non-image URLs
-        filtered_images = []
-        for url in images:
-            if self._is_valid_image_url(url):
-                filtered_images.append(url)
+        # Filter out non-image URLs
+        filtered_images = [url for url in images if self._is_valid_image_url(url)]
 
         # Limit to prevent hanging on too many URLs
         max_images = 100  # Reasonable limit for a chapter
@@ -306,79 +526,46 @@ class ManhwaScraper:
 
     def _is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image URL"""
-        if not url or not isinstance(url, str):
-            return False
-
-        # Skip blob URLs and data URLs
-        if url.startswith('blob:') or url.startswith('data:'):
-            return False
-
-        # Check for image extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-        url_lower = url.lower()
-
-        # Must have image extension
-        has_extension = any(ext in url_lower for ext in image_extensions)
-        if not has_extension:
-            return False
-
-        # Must be HTTP/HTTPS
-        if not url.startswith('http'):
-            return False
-
-        # Relax domain filtering: accept any http(s) domain to avoid missing valid CDNs
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            if not domain:
-                return False
-        except Exception as e:
-            logger.debug(f"Error parsing URL {url}: {e}")
-            return False
-
-        return True
-
-    def _construct_image_urls(self, chapter_url: str) -> List[str]:
-        """Try to construct image URLs based on common patterns"""
-        urls = []
-
-        try:
-            # Parse the chapter URL to understand the structure
-            parsed = urlparse(chapter_url)
-            base = f"{parsed.scheme}://{parsed.netloc}"
-
-            # Common patterns for manhwa image hosting
-            patterns = [
-                # Direct image patterns
-                chapter_url.replace('/chapter-', '/images/'),
-                chapter_url + '/images/',
-                # CDN patterns
-                chapter_url.replace('manhwaread.com', 'mancover.xyz'),
-                # API-like patterns
-                chapter_url + '/api/images',
-                chapter_url + '/assets/images',
-            ]
-
-            for pattern in patterns:
-                # Try to add image numbers - but limit to reasonable range
-                for i in range(1, 30):  # Reduced from 50 to 30
-                    img_patterns = [
-                        f"{pattern}/page_{i:03d}.jpg",
-                        f"{pattern}/{i:03d}.jpg",
-                        f"{pattern}/img_{i:03d}.jpg",
-                        f"{pattern}/image_{i:03d}.jpg",
-                        f"{pattern}/page_{i}.jpg",
-                    ]
-
-                    for img_url in img_patterns:
-                        if img_url not in urls:
-                            urls.append(img_url)
-
-        except Exception as e:
-            logger.debug(f"Error constructing URLs: {e}")
-
-        return urls
+        return _is_image_url(url)
+
+    def _image_url_templates(self, chapter_url: str) -> List[str]:
+        """Common manhwa image hosting patterns for a chapter, as str.format templates over {i}"""
+        # Escape braces so only {i} is a format field
+        chapter_url = chapter_url.replace('{', '{{').replace('}', '}}')
+        bases = [
+            # Direct image patterns
+            chapter_url.replace('/chapter-', '/images/'),
+            chapter_url + '/images/',
+            # CDN patterns
+            chapter_url.replace('manhwaread.com', 'mancover.xyz'),
+            # API-like patterns
+            chapter_url + '/api/images',
+            chapter_url + '/assets/images',
+        ]
+        names = ['page_{i:03d}.jpg', '{i:03d}.jpg', 'img_{i:03d}.jpg', 'image_{i:03d}.jpg', 'page_{i}.jpg']
+        return [f"{base}/{name}" for base in bases for name in names]
+
+    def _construct_image_urls(self, templates: List[str], pages: range = range(1, 30)) -> List[str]:
+        """Expand URL templates over a range of page numbers"""
+        urls: Dict[str, None] = {}
+        for template in templates:
+            for i in pages:
+                urls[template.format(i=i)] = None
+        return list(urls)
+
+    def _guess_image_urls(self, chapter_url: str) -> List[str]:
+        """Guess image URLs from common patterns, probing a few pages of each pattern first.
+        Only patterns whose probe succeeds are expanded to the full page range.
+        """
+        templates = self._image_url_templates(chapter_url)
+        probe_pages = range(1, 5)
+        hits = set(self.validate_image_urls(self._construct_image_urls(templates, probe_pages), referer=chapter_url))
+        live = [t for t in templates if any(t.format(i=i) in hits for i in probe_pages)]
+        if not live:
+            logger.debug(f"No guessed image URL pattern responded for {chapter_url}")
+            return []
+        logger.info(f"{len(live)} guessed image URL pattern(s) responded; expanding")
+        return self._construct_image_urls(live)
 
     def _download_with_playwright_request(self, url: str, filepath: Path, headers: Dict[str, str]) -> bool:
         """Try downloading via Playwright's authenticated request context to reuse cookies."""
@@ -400,9 +587,25 @@ class ManhwaScraper:
             logger.debug(f"Playwright request download failed for {url}: {e}")
             return False
 
-    def download_image(self, url: str, filepath: Path, referer: Optional[str] = None) -> bool:
-        """Download a single image with proper headers (handles hotlink protection)."""
-        headers = self._build_headers_for_image(referer)
+    def _download_with_http2(self, url: str, filepath: Path, headers: Dict[str, str]) -> bool:
+        """Try downloading over the multiplexed HTTP/2 connection."""
+        try:
+            with self.http2_client.stream('GET', url, headers=headers) as response:
+                response.raise_for_status()
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_bytes(chunk_size=1 << 18):
+                        f.write(chunk)
+            return True
+        except Exception as e:
+            logger.debug(f"HTTP/2 download failed for {url}: {e}")
+            return False
+
+    def download_image(self, url: str, filepath: Path, referer: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Download a single image with proper headers (handles hotlink protection).
+        Pass prebuilt `headers` to skip rebuilding them for every image of a chapter.
+        """
+        if headers is None:
+            headers = self._build_headers_for_image(referer)
         try:
             # If using Playwright, try its request context first (better for cookie-protected CDNs)
             if self.use_playwright and self.playwright_context is not None:
@@ -410,54 +613,57 @@ class ManhwaScraper:
                 if ok:
                     logger.debug(f"Downloaded via Playwright: {filepath}")
                     return True
+            if self.http2_client is not None:
+                if self._download_with_http2(url, filepath, headers):
+                    logger.debug(f"Downloaded via HTTP/2: {filepath}")
+                    return True
             # Fallback to requests
             with self.session.get(url, timeout=15, stream=True, headers=headers) as response:
                 response.raise_for_status()
+                # Copy straight from the socket in large blocks instead of 8 KiB Python chunks
+                response.raw.decode_content = True
                 with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=1 << 18)
             logger.debug(f"Downloaded: {filepath}")
             return True
         except Exception as e:
             logger.error(f"Error downloading {url}: {e}")
             return False
 
-    def test_image_url(self, url: str, referer: Optional[str] = None) -> bool:
-        """Test if an image URL is accessible. Uses HEAD first, with a lightweight GET fallback.
-        Adds Referer/Accept headers to bypass hotlink protection and uses short timeouts to avoid stalls.
+    def _probe_image_url(self, method: str, url: str, headers: Dict[str, str], timeout: float):
+        """Issue one streamed probe request (the body is never read); returns (status_code, looks_like_image)."""
+        if self.http2_client is not None:
+            with self.http2_client.stream(method, url, headers=headers, timeout=timeout) as response:
+                status = response.status_code
+                content_type = response.headers.get('content-type', '').lower()
+        else:
+            with self.session.request(method, url, timeout=timeout, allow_redirects=True, stream=True, headers=headers) as response:
+                status = response.status_code
+                content_type = response.headers.get('content-type', '').lower()
+        return status, status == 200 and (not content_type or 'image' in content_type)
+
+    def test_image_url(self, url: str, referer: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Test if an image URL is accessible with a single request: HEAD, or a streamed GET
+        for hosts already seen rejecting HEAD. Adds Referer/Accept headers to bypass hotlink
+        protection and uses short timeouts to avoid stalls.
         """
-        headers = self._build_headers_for_image(referer)
-        head_response = None
-        try:
-            head_response = self.session.head(url, timeout=6, allow_redirects=True, headers=headers)
-            if head_response.status_code == 200:
-                content_type = head_response.headers.get('content-type', '').lower()
-                if not content_type or 'image' in content_type:
-                    return True
-        except requests.RequestException as e:
-            logger.debug(f"HEAD request failed for {url}: {e}")
-        except Exception as e:
-            logger.debug(f"Unexpected error during HEAD request for {url}: {e}")
-        finally:
-            if head_response is not None:
-                head_response.close()
-
-        # Some CDNs block HEAD requests, so fall back to a light GET check before downloading.
+        if headers is None:
+            headers = self._build_headers_for_image(referer)
+        host = urlparse(url).netloc
         try:
-            with self.session.get(url, timeout=8, stream=True, headers=headers) as get_response:
-                if get_response.status_code == 200:
-                    content_type = get_response.headers.get('content-type', '').lower()
-                    if not content_type or 'image' in content_type:
-                        try:
-                            next(get_response.iter_content(chunk_size=512))
-                        except StopIteration:
-                            pass
-                        return True
+            if host not in self._head_blocked_hosts:
+                status, ok = self._probe_image_url('HEAD', url, headers, timeout=5)
+                if status not in _HEAD_BLOCKED_STATUSES:
+                    return ok
+                # Some CDNs block HEAD requests; use GET for this host from now on
+                logger.debug(f"HEAD rejected with {status} by {host}; probing with GET")
+                self._head_blocked_hosts.add(host)
+            _, ok = self._probe_image_url('GET', url, headers, timeout=8)
+            return ok
         except requests.RequestException as e:
-            logger.debug(f"GET request failed for {url}: {e}")
+            logger.debug(f"Probe request failed for {url}: {e}")
         except Exception as e:
-            logger.debug(f"Unexpected error during GET request for {url}: {e}")
+            logger.debug(f"Unexpected error while probing {url}: {e}")
         return False
 
     def validate_image_urls(self, urls: List[str], referer: Optional[str] = None, max_workers: Optional[int] = None) -> List[str]:
@@ -466,43 +672,98 @@ class ManhwaScraper:
         if not urls:
             return valid
 
+        headers = self._build_headers_for_image(referer)
+
         def check(u: str):
-            return u, self.test_image_url(u, referer=referer)
+            return u, self.test_image_url(u, referer=referer, headers=headers)
 
         if max_workers is None:
             max_workers = self.max_workers
         workers = max(1, min(max_workers, len(urls)))
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = [executor.submit(check, u) for u in urls]
-            completed = 0
-            for fut in as_completed(futures):
-                url, ok = fut.result()
-                completed += 1
-                if ok:
-                    valid.append(url)
-                if completed % 10 == 0:
-                    logger.debug(f"Validated {completed}/{len(urls)} URLs...")
-                if self.interrupted:
-                    logger.info("Validation interrupted by user")
-                    break
+        completed = 0
+        results = self._run_bounded(check, urls, workers)
+        for url, ok in results:
+            completed += 1
+            if ok:
+                valid.append(url)
+            if completed % 10 == 0:
+                logger.debug(f"Validated {completed}/{len(urls)} URLs...")
+            if self.interrupted:
+                logger.info("Validation interrupted by user")
+                results.close()
+                break
         return valid
 
-    def _download_one(self, idx_and_url, chapter_dir: Path, referer: Optional[str]) -> bool:
+    def _download_one(self, idx_and_url, chapter_dir: Path, referer: Optional[str], existing: Optional[Set[str]] = None, headers: Optional[Dict[str, str]] = None) -> bool:
         i, img_url = idx_and_url
         filename = f"page_{i:03d}.jpg"
         filepath = chapter_dir / filename
-        if filepath.exists():
+        # `existing` is a one-time listing of chapter_dir, avoiding a stat per page
+        if (filename in existing) if existing is not None else filepath.exists():
             logger.debug(f"Skipping existing file: {filepath}")
             return True
-        ok = self.download_image(img_url, filepath, referer=referer)
+        ok = self.download_image(img_url, filepath, referer=referer, headers=headers)
         if not ok:
             logger.warning(f"Failed to download page {i}: {img_url}")
         return ok
 
+    async def _download_chapter_async(self, indices_and_urls, chapter_dir: Path, referer: Optional[str], existing: Set[str]) -> int:
+        """Download a chapter's images concurrently on one event loop; returns the success count."""
+        import aiohttp
+        headers = self._build_headers_for_image(referer)
+        headers.setdefault('User-Agent', self.session.headers.get('User-Agent'))
+        semaphore = asyncio.Semaphore(self.async_concurrency)
+
+        async def fetch(client, i: int, img_url: str) -> bool:
+            filename = f"page_{i:03d}.jpg"
+            filepath = chapter_dir / filename
+            if filename in existing:
+                logger.debug(f"Skipping existing file: {filepath}")
+                return True
+            async with semaphore:
+                if self.interrupted:
+                    return False
+                try:
+                    request_headers = dict(headers)
+                    # Send the same cookies requests would (incl. those synced from Playwright)
+                    cookie = requests.cookies.get_cookie_header(self.session.cookies, requests.Request('GET', img_url))
+                    if cookie:
+                        request_headers['Cookie'] = cookie
+                    async with client.get(img_url, headers=request_headers) as resp:
+                        resp.raise_for_status()
+                        with open(filepath, 'wb') as f:
+                            async for chunk in resp.content.iter_chunked(1 << 17):
+                                f.write(chunk)
+                    logger.debug(f"Downloaded: {filepath}")
+                    return True
+                except Exception as e:
+                    logger.warning(f"Failed to download page {i}: {img_url} ({e})")
+                    return False
+
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=20)
+        timeout = aiohttp.ClientTimeout(total=30, sock_read=15)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as client:
+            results = await asyncio.gather(*(fetch(client, i, u) for i, u in indices_and_urls))
+        return sum(1 for ok in results if ok)
+
+    def _download_images_async(self, indices_and_urls, chapter_dir: Path, referer: Optional[str], existing: Set[str]) -> Optional[int]:
+        """Run the aiohttp download path; returns None if aiohttp is not installed."""
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            logger.warning("aiohttp is not installed (pip install aiohttp), falling back to threaded downloads")
+            self.async_io = False
+            return None
+        return asyncio.run(self._download_chapter_async(indices_and_urls, chapter_dir, referer, existing))
+
+    def chapter_dir(self, manhwa_title: str, chapter: Dict[str, str]) -> Path:
+        """Directory a chapter's pages are saved to"""
+        chapter_title = self.sanitize_filename(chapter['title'])
+        return self.download_dir / manhwa_title / f"Chapter_{chapter['number']}_{chapter_title}"
+
     def download_chapter(self, manhwa_title: str, chapter: Dict[str, str], delay: float = 1.0) -> bool:
         """Download all images from a chapter"""
-        chapter_title = self.sanitize_filename(chapter['title'])
-        chapter_dir = self.download_dir / manhwa_title / f"Chapter_{chapter['number']}_{chapter_title}"
+        chapter_dir = self.chapter_dir(manhwa_title, chapter)
         self.create_directory(chapter_dir)
 
         logger.info(f"Downloading chapter {chapter['number']}: {chapter['title']}")
@@ -515,7 +776,7 @@ class ManhwaScraper:
         # Filter out URLs that don't exist (optional)
         if self.validate_urls:
             logger.info(f"Validating {len(images)} potential image URLs...")
-            valid_images = self.validate_image_urls(images, referer=chapter['url'], max_workers=10)
+            valid_images = self.validate_image_urls(images, referer=chapter['url'])
         else:
             logger.info(f"Skipping URL validation; attempting downloads for {len(images)} images")
             valid_images = images
@@ -526,23 +787,37 @@ class ManhwaScraper:
 
         logger.info(f"Found {len(valid_images)} valid images for chapter {chapter['number']}")
 
-        # Download images concurrently
-        logger.info(f"Downloading {len(valid_images)} images with concurrency={self.max_workers}")
         indices_and_urls = list(enumerate(valid_images, 1))
-        success_count = 0
-        workers = max(1, min(self.max_workers, len(indices_and_urls)))
-        if self.use_playwright:
-            workers = min(workers, 2)
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = [executor.submit(self._download_one, iu, chapter_dir, chapter['url']) for iu in indices_and_urls]
-            for fut in as_completed(futures):
-                if fut.result():
+        # List the chapter directory once instead of stat-ing every page file
+        existing = set(os.listdir(chapter_dir))
+        success_count = None
+        # asyncio fan-out (Playwright downloads need the sync API, so they stay threaded)
+        if self.async_io and not self.use_playwright:
+            logger.info(f"Downloading {len(valid_images)} images with asyncio (concurrency={self.async_concurrency})")
+            success_count = self._download_images_async(indices_and_urls, chapter_dir, chapter['url'], existing)
+
+        if success_count is None:
+            # Download images concurrently
+            logger.info(f"Downloading {len(valid_images)} images with concurrency={self.max_workers}")
+            success_count = 0
+            workers = max(1, min(self.max_workers, len(indices_and_urls)))
+            if self.use_playwright:
+                workers = min(workers, 2)
+            # Referer is the chapter page for every image, so build the headers once
+            headers = self._build_headers_for_image(chapter['url'])
+            download_one = functools.partial(self._download_one, chapter_dir=chapter_dir, referer=chapter['url'], existing=existing, headers=headers)
+            results = self._run_bounded(download_one, indices_and_urls, workers)
+            for ok in results:
+                if ok:
                     success_count += 1
                 if self.interrupted:
                     logger.info(f"Download interrupted after {success_count} images")
+                    results.close()
                     break
 
         logger.info(f"Downloaded {success_count}/{len(valid_images)} images for chapter {chapter['number']}")
+        if success_count == len(valid_images):
+            (chapter_dir / _COMPLETE_MARKER).write_text(str(success_count))
         return success_count > 0
 
     def download_manhwa(self, manhwa_info: Dict[str, str], delay: float = 1.0) -> bool:
@@ -555,36 +830,81 @@ class ManhwaScraper:
             logger.error(f"No chapters found for {title}")
             return False
 
-        success_count = 0
-        for chapter in chapters:
-            if self.download_chapter(title, chapter, delay):
-                success_count += 1
-
-            # Add delay between chapters
+        def run(chapter: Dict[str, str]) -> bool:
+            ok = self.download_chapter(title, chapter, delay)
+            # Add delay between chapters (per worker)
             time.sleep(delay)
+            return ok
+
+        success_count = 0
+        if self.use_playwright:
+            # Sync Playwright objects only work on the thread that created them,
+            # so run chapters one by one on this (the page-owning) thread
+            for chapter in chapters:
+                try:
+                    if run(chapter):
+                        success_count += 1
+                except Exception as e:
+                    logger.error(f"Error downloading chapter of {title}: {e}")
+                if self.interrupted:
+                    logger.info(f"Chapter downloads interrupted after {success_count} chapters")
+                    break
+        else:
+            # Chapters are I/O bound, so download a few at once
+            workers = min(self.chapter_workers, len(chapters))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run, chapter) for chapter in chapters]
+                for fut in as_completed(futures):
+                    try:
+                        if fut.result():
+                            success_count += 1
+                    except Exception as e:
+                        logger.error(f"Error downloading chapter of {title}: {e}")
+                    if self.interrupted:
+                        for pending in futures:
+                            pending.cancel()
+                        logger.info(f"Chapter downloads interrupted after {success_count} chapters")
+                        break
 
         logger.info(f"Completed {title}: {success_count}/{len(chapters)} chapters downloaded")
         return success_count > 0
 
-    def download_all(self, manhwa_list: List[Dict[str, str]], delay: float = 1.0) -> None:
-        """Download all manhwa in the list"""
+    def download_all(self, manhwa_list: List[Dict[str, str]], delay: float = 1.0, title_workers: int = 1) -> None:
+        """Download all manhwa in the list, up to ``title_workers`` series at once"""
         logger.info(f"Starting download of {len(manhwa_list)} manhwa series")
 
         # Set up signal handler for graceful interruption
         signal.signal(signal.SIGINT, self.signal_handler)
 
-        for manhwa_info in manhwa_list:
+        def run(manhwa_info: Dict[str, str]) -> None:
             if self.interrupted:
                 logger.info("Download interrupted by user")
-                break
-
+                return
             try:
                 self.download_manhwa(manhwa_info, delay)
                 logger.info(f"Completed: {manhwa_info['title']}")
             except Exception as e:
                 logger.error(f"Error downloading {manhwa_info['title']}: {e}")
-        # Clean up Playwright if it was used
-        self._close_playwright()
+
+        # Series are independent, so they can overlap. With Playwright (whose
+        # objects belong to the thread that created them) or a single worker,
+        # stay on this thread so close() runs where the browser lives.
+        workers = 1 if self.use_playwright else max(1, min(title_workers, len(manhwa_list)))
+        with self._pool_lock:
+            resized = workers != self.title_workers
+            self.title_workers = workers
+            # An existing pool was sized for the old title count; rebuild it on next use
+            stale, self._pool = (self._pool, None) if resized else (None, self._pool)
+        if stale is not None:
+            stale.shutdown(wait=True)
+        if workers == 1:
+            for manhwa_info in manhwa_list:
+                run(manhwa_info)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='title') as executor:
+                list(executor.map(run, manhwa_list))
+        # Clean up Playwright / HTTP/2 client if they were used
+        self.close()
 
 def main():
     # Manhwa list from user
@@ -619,10 +939,17 @@ def main():
     parser.add_argument('--pw-wait', type=float, default=3.0, help='Extra wait in seconds after Playwright loads a page')
     parser.add_argument('--validate-urls', action='store_true', help='Validate image URLs (HEAD/GET) before downloading. May be slow; off by default')
     parser.add_argument('--max-workers', type=int, default=6, help='Max concurrent workers for validation and downloads')
+    parser.add_argument('--chapter-workers', type=int, default=3, help='Max chapters downloaded concurrently')
+    parser.add_argument('--title-workers', type=int, default=1, help='Max manhwa series downloaded concurrently')
+    parser.add_argument('--parse-processes', type=int, default=0, help='Parse pages in this many worker processes (0 parses in-thread)')
+    parser.add_argument('--guess-urls', action='store_true', help='When a chapter page yields no images, probe common image URL patterns')
+    parser.add_argument('--async-io', action='store_true', help='Download chapter images with asyncio + aiohttp instead of threads')
+    parser.add_argument('--async-concurrency', type=int, default=20, help='Max in-flight image requests per chapter with --async-io')
+    parser.add_argument('--http2', action='store_true', help='Use an HTTP/2 client (requires httpx[http2]) to multiplex requests per host')
 
     args = parser.parse_args()
 
-    scraper = ManhwaScraper(download_dir=args.download_dir, use_playwright=args.use_playwright, playwright_wait=args.pw_wait, validate_urls=args.validate_urls, max_workers=args.max_workers)
+    scraper = ManhwaScraper(download_dir=args.download_dir, use_playwright=args.use_playwright, playwright_wait=args.pw_wait, validate_urls=args.validate_urls, max_workers=args.max_workers, chapter_workers=args.chapter_workers, use_http2=args.http2, guess_image_urls=args.guess_urls, async_io=args.async_io, async_concurrency=args.async_concurrency, parse_processes=args.parse_processes)
 
     if args.list_only:
         # Just list chapters for each manhwa
@@ -635,7 +962,7 @@ def main():
             logger.info(f"Total: {len(chapters)} chapters\n")
     else:
         # Download all
-        scraper.download_all(manhwa_list, delay=args.delay)
+        scraper.download_all(manhwa_list, delay=args.delay, title_workers=args.title_workers)
         logger.info("Download completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the worker helpers - bounded submission, disk writer, host limiter
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from manhwa_scraper import ManhwaScraper
+from toongod_scraper import ToonGodScraper
+
+
+def check_run_bounded_refills(scraper):
+    """One slow item must not stall the window: the rest finish around it"""
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(i):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        if i == 0:
+            release.wait(5)
+        with lock:
+            in_flight -= 1
+        return i
+
+    results = []
+    try:
+        for r in scraper._run_bounded(work, range(12), 3):
+            results.append(r)
+            if len(results) == 11:
+                release.set()
+    finally:
+        release.set()
+        scraper.close()
+    assert sorted(results) == list(range(12))
+    assert results[-1] == 0, f"slow item blocked the window: {results}"
+    assert peak <= 3, f"{peak} tasks in flight, limit was 3"
+
+
+def test_manhwa_run_bounded_refills():
+    check_run_bounded_refills(ManhwaScraper())
+
+
+def test_toongod_run_bounded_refills():
+    check_run_bounded_refills(ToonGodScraper())
+
+
+def test_disk_writer_writes_and_closes_fd():
+    from manhwa_scraper_rnet import _DiskWriter
+    writer = _DiskWriter()
+    fd, path = tempfile.mkstemp()
+    try:
+        writer.write(fd, [b"ab", b"cd"], 4)
+        writer.write(fd, [b"ef"], 2)
+        writer.finish(fd)
+        assert Path(path).read_bytes() == b"abcdef"
+        try:
+            os.fstat(fd)
+        except OSError:
+            pass
+        else:
+            raise AssertionError("finish() left the fd open")
+    finally:
+        writer.close()
+        os.unlink(path)
+
+
+def test_disk_writer_rejects_work_after_close():
+    """write()/finish() after close() raise instead of blocking forever"""
+    from manhwa_scraper_rnet import _DiskWriter
+    writer = _DiskWriter()
+    writer.close()
+    writer.close()  # idempotent
+    fd, path = tempfile.mkstemp()
+    outcome = {}
+
+    def late_download():
+        try:
+            writer.write(fd, [b"x"], 1)
+        except RuntimeError:
+            outcome['write'] = 'raised'
+        try:
+            writer.finish(fd)
+        except RuntimeError:
+            outcome['finish'] = 'raised'
+
+    t = threading.Thread(target=late_download, daemon=True)
+    t.start()
+    t.join(5)
+    try:
+        assert not t.is_alive(), "write/finish after close() hung"
+        assert outcome == {'write': 'raised', 'finish': 'raised'}
+        try:
+            os.fstat(fd)
+        except OSError:
+            pass
+        else:
+            raise AssertionError("finish() after close() left the fd open")
+    finally:
+        os.unlink(path)
+
+
+def test_host_limiter_aimd():
+    """Slots per host grow by one on success and halve on throttling"""
+    from manhwa_scraper_rnet import _HostLimiter
+    limiter = _HostLimiter(initial=2, ceiling=3)
+    peak = 0
+    in_flight = 0
+    lock = threading.Lock()
+
+    def use_slot():
+        nonlocal peak, in_flight
+        with limiter.slot("cdn"):
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+
+    def burst(n=6):
+        nonlocal peak
+        peak = 0
+        threads = [threading.Thread(target=use_slot) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        return peak
+
+    assert burst() == 2
+    limiter.record("cdn", throttled=False)
+    limiter.record("cdn", throttled=False)  # capped at the ceiling
+    assert burst() == 3
+    limiter.record("cdn", throttled=True)
+    assert burst() == 1
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Offline extraction tests - parse saved pages from test_fixtures/, no network
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import toongod_scraper
+from manhwa_scraper import _parse_chapter_links, _scan_chapter_images
+from toongod_scraper import ToonGodScraper, _iter_chapter_anchors, _parse_chapter_images
+
+FIXTURES = Path(__file__).parent / "test_fixtures"
+BASE_URL = "https://manhwaread.com"
+TOONGOD_SERIES_URL = "https://www.toongod.org/webtoon/magnetic-pull/"
+
+# What the original multi-pass extract_images_from_chapter (Methods 1-4, before
+# the single-walk rewrite) found on manhwa_chapter.html
+BASELINE_CHAPTER_IMAGES = {
+    "https://manhwaread.com/wp-content/themes/mr/img/logo.png",
+    "https://cdn.manhwaread.com/only-you/12/001.jpg",
+    "https://cdn.manhwaread.com/only-you/12/002.jpg",
+    "https://cdn.manhwaread.com/only-you/12/004.webp",
+    "https://cdn.manhwaread.com/only-you/12/008.jpg",
+    "https://manhwaread.com/only-you/12/009.jpg",
+    "https://cdn.manhwaread.com/only-you/12/011.jpg",
+    "https://manhwaread.com/wp-content/uploads/covers/only-you.jpg",
+    "https://manhwaread.com/wp-content/themes/mr/img/paper.png",
+    "https://cdn2.manhwaread.com/only-you/12/006.jpg",
+    "https://cdn.manhwaread.com/only-you/12/007-full.jpg",
+    "https://ads.example.net/banner/summer.gif",
+    "https://cdn3.manhwaread.com/only-you/12/010.jpg",
+    "https://manhwaread.com/wp-content/themes/mr/img/loading.gif",
+    "https://manhwaread.com/rel/003.jpg",
+    "https://manhwaread.com/only-you/12/005.png",
+}
+
+# Original extract_chapters output for manhwa_series.html (number, title, url)
+BASELINE_SERIES_CHAPTERS = [
+    ("1", "Read First", "https://manhwaread.com/manhwa/only-you/chapter-1/"),
+    ("2", "Chapter 2", "https://manhwaread.com/manhwa/only-you/chapter-2/"),
+    ("3", "Chapter 3", "https://manhwaread.com/manhwa/only-you/chapter-3/"),
+    ("8", "Chapter 8", "https://manhwaread.com/manhwa/only-you/chapter-8/"),
+    ("9", "Chapter 9", "https://manhwaread.com/manhwa/only-you/chapter-9/"),
+    ("10", "Chapter10", "https://manhwaread.com/manhwa/only-you/chapter-10/"),
+    ("11", "Chapter 11", "https://manhwaread.com/manhwa/only-you/chapter-11/"),
+    ("12", "Read Last", "https://manhwaread.com/manhwa/only-you/chapter-12/"),
+    ("40", "Magnetic Pull Chapter 40", "https://manhwaread.com/manhwa/magnetic-pull/chapter-40/"),
+]
+
+# Original ToonGod extract_images_from_chapter output for toongod_chapter.html
+BASELINE_TOONGOD_IMAGES = [
+    "https://cdn.toongod.org/magnetic-pull/3/02.jpg",
+    "https://cdn.toongod.org/magnetic-pull/3/03.webp",
+    "https://cdn.toongod.org/magnetic-pull/3/04.jpeg?v=2",
+    "https://cdn.toongod.org/magnetic-pull/3/05.PNG",
+    "https://www.toongod.org/wp-content/uploads/2023/05/magnetic-pull-cover.jpg",
+    "https://cdn.toongod.org/magnetic-pull/3/01.jpg",
+    "https://cdn.toongod.org/magnetic-pull/3/06.jpg",
+    "https://www.toongod.org/wp-content/uploads/logo.png",
+    "https://www.toongod.org/wp-content/themes/madara/images/dflazy.jpg",
+    "https://cdn.toongod.org/magnetic-pull/3/04.jpeg",
+    "https://www.toongod.org/9f2c.jpg",
+    "https://mirror.toongod.org/magnetic-pull/3/07.gif",
+    "https://ads.example.net/toon/banner.gif",
+]
+
+# Original ToonGod series-page anchor fallback for toongod_series.html
+BASELINE_TOONGOD_CHAPTERS = [
+    ("prologue", "Read First", "https://www.toongod.org/webtoon/magnetic-pull/chapter-prologue/"),
+    ("1", "Chapter 1", "https://www.toongod.org/webtoon/magnetic-pull/chapter-1/"),
+    ("2", "Chapter 2", "https://www.toongod.org/webtoon/magnetic-pull/chapter-2/"),
+    ("5-5", "Chapter 5.5 - Special", "https://www.toongod.org/webtoon/magnetic-pull/chapter-5-5/"),
+    ("10", "Chapter 10", "https://www.toongod.org/webtoon/magnetic-pull/chapter-10"),
+    ("11", "Chapter11", "https://www.toongod.org/webtoon/magnetic-pull/chapter-11/"),
+    ("12", "Read Last", "https://www.toongod.org/webtoon/magnetic-pull/chapter-12/"),
+]
+
+
+def load(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def test_scan_chapter_images_matches_baseline():
+    """The single tree walk finds the same URLs as the old multi-pass scan"""
+    images = _scan_chapter_images(load("manhwa_chapter.html"), BASE_URL)
+    assert len(images) == len(set(images)), "duplicate URLs"
+    assert set(images) == BASELINE_CHAPTER_IMAGES, set(images) ^ BASELINE_CHAPTER_IMAGES
+
+
+def test_scan_chapter_images_order():
+    """<img> pages come first, in page order, with relative sources resolved"""
+    images = _scan_chapter_images(load("manhwa_chapter.html"), BASE_URL)
+    assert images[1:6] == [
+        "https://cdn.manhwaread.com/only-you/12/001.jpg",
+        "https://cdn.manhwaread.com/only-you/12/002.jpg",
+        "https://manhwaread.com/rel/003.jpg",
+        "https://cdn.manhwaread.com/only-you/12/004.webp",
+        "https://cdn.manhwaread.com/only-you/12/008.jpg",
+    ]
+
+
+def test_parse_chapter_links_matches_baseline():
+    """Strainer-based chapter parsing keeps the original numbering, titles and order"""
+    chapters = _parse_chapter_links(load("manhwa_series.html"), BASE_URL)
+    assert [(c["number"], c["title"], c["url"]) for c in chapters] == BASELINE_SERIES_CHAPTERS
+
+
+def test_toongod_chapter_images_matches_baseline():
+    """Module-level parser and raw-bytes fallback scan match the original list"""
+    assert _parse_chapter_images(load("toongod_chapter.html")) == BASELINE_TOONGOD_IMAGES
+
+
+def test_toongod_extract_images_from_chapter():
+    """extract_images_from_chapter hands the fetched bytes to the parser"""
+    scraper = ToonGodScraper()
+    scraper._get_html = lambda url: load("toongod_chapter.html")
+    try:
+        assert scraper.extract_images_from_chapter(TOONGOD_SERIES_URL + "chapter-3/") == BASELINE_TOONGOD_IMAGES
+    finally:
+        scraper.close()
+
+
+def test_toongod_parse_pool_survives_dead_worker():
+    """A parse worker process dying drops back to in-thread parsing with the same result"""
+    scraper = ToonGodScraper(parse_processes=1)
+    scraper._get_html = lambda url: load("toongod_chapter.html")
+    try:
+        assert scraper.extract_images_from_chapter(TOONGOD_SERIES_URL + "chapter-3/") == BASELINE_TOONGOD_IMAGES
+        pool = scraper._get_parse_pool()
+        for proc in list(pool._processes.values()):
+            proc.kill()
+        time.sleep(0.5)
+        assert scraper.extract_images_from_chapter(TOONGOD_SERIES_URL + "chapter-3/") == BASELINE_TOONGOD_IMAGES
+        assert scraper._get_parse_pool() is None
+    finally:
+        scraper.close()
+
+
+def test_toongod_series_fallback_matches_baseline():
+    """Series-page anchor fallback (stream-parsed) dedupes and sorts like the original"""
+    scraper = ToonGodScraper()
+    # Force the last-resort anchor scan over the saved page
+    scraper._fetch_chapters_via_ajax = lambda url, series_html=None: []
+    try:
+        chapters = scraper.extract_chapters(TOONGOD_SERIES_URL, series_html=load("toongod_series.html"))
+    finally:
+        scraper.close()
+    assert [(c["number"], c["title"], c["url"]) for c in chapters] == BASELINE_TOONGOD_CHAPTERS
+
+
+def test_iter_chapter_anchors_without_lxml():
+    """The lxml iterparse path and the BeautifulSoup fallback yield the same anchors"""
+    html = load("toongod_series.html")
+    streamed = list(_iter_chapter_anchors(html))
+    etree = toongod_scraper.etree
+    toongod_scraper.etree = None
+    try:
+        fallback = list(_iter_chapter_anchors(html))
+    finally:
+        toongod_scraper.etree = etree
+    assert streamed == fallback
+    assert ("/webtoon/magnetic-pull/chapter-11/", "Chapter11") in streamed
+    assert all("/comments/" not in href for href, _ in streamed)
+
+
+def test_iter_chapter_anchors_detects_encoding():
+    """Non-ASCII titles survive a page that declares no charset"""
+    html = (
+        '<html><body><ul>'
+        '<li><a href="/webtoon/magnetic-pull/chapter-1/">Chapitre 1 – Début</a></li>'
+        '<li><a href="/webtoon/magnetic-pull/chapter-2/"><span>Chapitre</span> 2 – Fin</a></li>'
+        '</ul></body></html>'
+    ).encode("utf-8")
+    assert list(_iter_chapter_anchors(html)) == [
+        ("/webtoon/magnetic-pull/chapter-1/", "Chapitre 1 – Début"),
+        ("/webtoon/magnetic-pull/chapter-2/", "Chapitre2 – Fin"),
+    ]
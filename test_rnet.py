@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the rnet scraper - chapter resume, URL probing, retry budget and cookie loading, no network
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from manhwa_scraper_rnet import ManhwaScraperRNet, _cookie_header_from_jar
+
+CHAPTER = {"number": "12", "title": "Chapter 12", "url": "https://manhwaread.com/manhwa/only-you/chapter-12/"}
+PAGES = [f"https://cdn.manhwaread.com/only-you/12/{i:03d}.jpg" for i in range(1, 7)]
+
+
+def offline_scraper(download_dir: str, fetched: list) -> ManhwaScraperRNet:
+    """A scraper whose chapter page and image requests are recorded, never sent"""
+    scraper = ManhwaScraperRNet(download_dir=download_dir)
+
+    def extract(url):
+        fetched.append(url)
+        return list(PAGES)
+
+    def download(url, filepath, referer=None, headers=None):
+        fetched.append(url)
+        filepath.write_bytes(b"\xff\xd8\xff" + url.encode())
+        return True
+
+    scraper.extract_images_from_chapter = extract
+    scraper.download_image = download
+    return scraper
+
+
+def test_finished_chapter_is_skipped():
+    """A chapter that completed once is not fetched again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        fetched = []
+        scraper = offline_scraper(tmp, fetched)
+        try:
+            assert scraper.download_chapter("Only You", CHAPTER)
+            assert len(fetched) == 1 + len(PAGES)
+            fetched.clear()
+            assert scraper.download_chapter("Only You", CHAPTER)
+            assert fetched == []
+        finally:
+            scraper.close()
+
+
+def test_partial_chapter_resumes():
+    """Pages left over from an interrupted run don't mark the chapter done"""
+    with tempfile.TemporaryDirectory() as tmp:
+        fetched = []
+        scraper = offline_scraper(tmp, fetched)
+        chapter_dir = scraper.chapter_dir("Only You", CHAPTER)
+        chapter_dir.mkdir(parents=True)
+        for i in range(1, 6):
+            (chapter_dir / f"page_{i:03d}.jpg").write_bytes(b"\xff\xd8\xff")
+        try:
+            assert scraper.download_chapter("Only You", CHAPTER)
+            # Chapter page re-read, only the missing page downloaded
+            assert fetched == [CHAPTER["url"], PAGES[-1]]
+            assert (chapter_dir / "page_006.jpg").exists()
+            assert scraper._is_chapter_cached(chapter_dir)
+        finally:
+            scraper.close()
+
+
+def test_validate_keeps_page_order():
+    """Probes finish in any order; valid URLs come back in page order"""
+    delays = {PAGES[0]: 0.2, PAGES[1]: 0.0, PAGES[2]: 0.1, PAGES[3]: 0.0}
+    scraper = ManhwaScraperRNet(workers=4)
+    scraper.test_image_url = lambda url, referer=None: time.sleep(delays[url]) or url != PAGES[2]
+    try:
+        assert scraper.validate_image_urls(PAGES[:4]) == [PAGES[0], PAGES[1], PAGES[3]]
+    finally:
+        scraper.close()
+
+
+def test_probe_fail_limit_stops_early():
+    """After the fail limit, the remaining probes are cancelled and report None"""
+    probed = []
+    scraper = ManhwaScraperRNet(workers=2, probe_fail_limit=1)
+
+    def probe(url, referer=None):
+        probed.append(url)
+        time.sleep(0.05 if url != PAGES[1] else 0)
+        return url != PAGES[1]
+
+    scraper.test_image_url = probe
+    try:
+        results = scraper.probe_many(PAGES, stop_after_fail=1)
+        assert [url for url, _ in results] == PAGES
+        assert results[1] == (PAGES[1], False)
+        assert all(ok is None for _, ok in results[3:])
+        assert len(probed) < len(PAGES)
+        valid = scraper.validate_image_urls(PAGES)
+        assert PAGES[1] not in valid and PAGES[-1] not in valid
+    finally:
+        scraper.close()
+
+
+class _Status503:
+    """Stands in for an rnet response: a context manager with a 503 status"""
+    status = "503 Service Unavailable"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _ThrottledClient:
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, timeout, headers):
+        self.timeouts.append(timeout)
+        return _Status503()
+
+
+def test_attempt_timeout_is_capped_by_budget():
+    """Per-attempt timeouts never exceed the client timeout or what's left of the budget"""
+    scraper = ManhwaScraperRNet(timeout=10)
+    try:
+        now = time.monotonic()
+        assert scraper._attempt_timeout(now + 60) == 10
+        assert scraper._attempt_timeout(now + 3.5) == 3
+        assert scraper._attempt_timeout(now + 0.2) == 1
+        assert scraper._attempt_timeout(now - 1) == 0
+    finally:
+        scraper.close()
+
+
+def test_fetch_gives_up_when_budget_is_spent():
+    """Retries on 503 stop at the wall-clock budget, not after the full retry ladder"""
+    scraper = ManhwaScraperRNet(request_budget=0.5)
+    scraper._client = _ThrottledClient()
+    sleeps = []
+    scraper._backoff_sleep = lambda attempt, deadline: sleeps.append(attempt) or time.sleep(0.6)
+    try:
+        start = time.monotonic()
+        with pytest.raises(requests.RequestException):
+            scraper._fetch_html(CHAPTER["url"])
+        assert time.monotonic() - start < 2
+        assert scraper._client.timeouts == [1]
+        assert sleeps == [1]
+    finally:
+        scraper.close()
+
+
+def test_cookie_jar_keeps_only_site_cookies():
+    """Only well-formed, non-comment manhwaread.com lines end up in the Cookie header"""
+    jar = "\r\n".join([
+        "# Netscape HTTP Cookie File",
+        "#HttpOnly_.manhwaread.com\tTRUE\t/\tTRUE\t0\tcommented\tx",
+        ".manhwaread.com\tTRUE\t/\tTRUE\t1999999999\tcf_clearance\tabc123",
+        ".example.com\tTRUE\t/\tFALSE\t1999999999\tother\tnope",
+        "manhwaread.com\tFALSE\t/\tFALSE\t0\tsession\tdef456",
+        "manhwaread.com\tFALSE\t/\tFALSE\t0\tempty\t",
+        "manhwaread.com\tFALSE\t/",
+        "",
+    ])
+    assert _cookie_header_from_jar(jar) == "cf_clearance=abc123; session=def456"
+    assert _cookie_header_from_jar("# only comments\n") is None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Offline tests for ToonGod session and download plumbing - no network
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import requests
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from toongod_scraper import ToonGodScraper, _is_cacheable_page
+
+SERIES_URL = "https://www.toongod.org/webtoon/magnetic-pull/"
+
+
+def response(url: str, content_type: str) -> requests.Response:
+    r = requests.Response()
+    r.url = url
+    r.status_code = 200
+    r.headers['Content-Type'] = content_type
+    return r
+
+
+def test_cache_filter_keeps_pages_only():
+    """Images stay out of the HTTP cache even when the CDN mislabels them"""
+    assert _is_cacheable_page(response("https://www.toongod.org/webtoon/magnetic-pull/", "text/html; charset=UTF-8"))
+    assert _is_cacheable_page(response("https://www.toongod.org/wp-admin/admin-ajax.php", "application/json"))
+    assert not _is_cacheable_page(response("https://cdn.toongod.org/magnetic-pull/3/01.jpg", "Image/JPEG"))
+    assert not _is_cacheable_page(response("https://cdn.toongod.org/magnetic-pull/3/02.webp?v=2", "application/octet-stream"))
+    assert not _is_cacheable_page(response("https://cdn.toongod.org/magnetic-pull/3/03.PNG", ""))
+
+
+def test_download_series_hands_prefetched_pages_to_workers():
+    """Pages beyond the first wave are prefetched once and handed to download_chapter"""
+    scraper = ToonGodScraper(chapter_workers=2)
+    chapters = [{"number": str(n), "title": f"Chapter {n}", "url": f"{SERIES_URL}chapter-{n}/"} for n in range(1, 7)]
+    prefetched = []
+    handed = {}
+    lock = threading.Lock()
+
+    def extract_images(url):
+        with lock:
+            prefetched.append(url)
+        if url.endswith("chapter-5/"):
+            raise RuntimeError("prefetch failed")
+        return [url + "01.jpg"]
+
+    def download_chapter(series_title, chapter, delay, imgs=None):
+        with lock:
+            handed[chapter["number"]] = imgs
+        return True
+
+    scraper._get_html = lambda url: b"<html><h1>Magnetic Pull</h1></html>"
+    scraper.extract_chapters = lambda url, series_html=None: chapters
+    scraper.extract_images_from_chapter = extract_images
+    scraper.download_chapter = download_chapter
+    scraper.download_series(SERIES_URL, delay=0)
+
+    assert sorted(prefetched) == [c["url"] for c in chapters[2:]]
+    # The first wave fetches its own pages, and a failed prefetch falls back to that too
+    assert handed == {
+        "1": None, "2": None, "3": [chapters[2]["url"] + "01.jpg"],
+        "4": [chapters[3]["url"] + "01.jpg"], "5": None, "6": [chapters[5]["url"] + "01.jpg"],
+    }
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Offline URL-probing tests - requests are stubbed, no network
+"""
+
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+import requests
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from manhwa_scraper import ManhwaScraper
+from toongod_scraper import ToonGodScraper, _looks_like_image
+
+CHAPTER_URL = "https://manhwaread.com/manhwa/only-you/chapter-12"
+
+
+def test_guess_image_urls_expands_only_live_templates():
+    """A few pages of each pattern are probed; only patterns that answer are expanded"""
+    scraper = ManhwaScraper()
+    live = CHAPTER_URL.replace('/chapter-', '/images/') + "/{i:03d}.jpg"
+    probed = []
+
+    def validate(urls, referer=None, max_workers=None):
+        probed.extend(urls)
+        return [u for u in urls if u in (live.format(i=1), live.format(i=2))]
+
+    scraper.validate_image_urls = validate
+    try:
+        guessed = scraper._guess_image_urls(CHAPTER_URL)
+    finally:
+        scraper.close()
+    templates = scraper._image_url_templates(CHAPTER_URL)
+    assert len(probed) == len(templates) * 4
+    assert guessed == [live.format(i=i) for i in range(1, 30)]
+
+
+def test_guess_image_urls_gives_up_without_hits():
+    """No responding pattern means no brute-force page list at all"""
+    scraper = ManhwaScraper()
+    scraper.validate_image_urls = lambda urls, referer=None, max_workers=None: []
+    try:
+        assert scraper._guess_image_urls(CHAPTER_URL) == []
+    finally:
+        scraper.close()
+
+
+def test_head_blocked_host_switches_to_get():
+    """A host that rejects HEAD is probed with GET from then on, other hosts keep HEAD"""
+    scraper = ManhwaScraper()
+    calls = []
+
+    def probe(method, url, headers, timeout):
+        calls.append((method, url))
+        if method == 'HEAD' and 'strict-cdn' in url:
+            return 405, False
+        return 200, True
+
+    scraper._probe_image_url = probe
+    try:
+        assert scraper.test_image_url("https://strict-cdn.example/1.jpg")
+        assert scraper.test_image_url("https://strict-cdn.example/2.jpg")
+        assert scraper.test_image_url("https://cdn.manhwaread.com/3.jpg")
+    finally:
+        scraper.close()
+    assert calls == [
+        ('HEAD', "https://strict-cdn.example/1.jpg"),
+        ('GET', "https://strict-cdn.example/1.jpg"),
+        ('GET', "https://strict-cdn.example/2.jpg"),
+        ('HEAD', "https://cdn.manhwaread.com/3.jpg"),
+    ]
+
+
+def test_looks_like_image_magic_bytes():
+    """JPEG, PNG, GIF and WebP signatures are recognised; markup and truncated RIFF are not"""
+    assert _looks_like_image(b"\xff\xd8\xff\xe0\x00\x10JFIF")
+    assert _looks_like_image(b"\x89PNG\r\n\x1a\n")
+    assert _looks_like_image(b"GIF89a")
+    assert _looks_like_image(b"RIFF\x24\x00\x00\x00WEBPVP8 ")
+    assert not _looks_like_image(b"RIFF\x24\x00\x00\x00WAVE")
+    assert not _looks_like_image(b"RIFF")
+    assert not _looks_like_image(b"<!DOCTYPE html>")
+    assert not _looks_like_image(b"")
+
+
+class _RangedSession:
+    """Answers every GET with 206 and the given body/content-type, recording requests"""
+
+    def __init__(self, body: bytes, content_type: str):
+        self.body = body
+        self.content_type = content_type
+        self.requests = []
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        self.requests.append(('GET', url, dict(headers or {})))
+        r = requests.Response()
+        r.status_code = 206
+        r.headers['Content-Type'] = self.content_type
+        r.raw = BytesIO(self.body)
+        return r
+
+    def head(self, *args, **kwargs):
+        raise AssertionError("test_image_url should not send HEAD")
+
+
+def test_toongod_probe_is_one_ranged_get():
+    """An untyped body is sniffed from the ranged GET instead of a second request"""
+    scraper = ToonGodScraper()
+    try:
+        for body, expected in ((b"\xff\xd8\xff\xe0" + b"\0" * 64, True), (b"<html>blocked</html>", False)):
+            scraper.session = _RangedSession(body, "application/octet-stream")
+            assert scraper.test_image_url("https://cdn.toongod.org/magnetic-pull/3/01.jpg", referer=None) is expected
+            [(method, _, headers)] = scraper.session.requests
+            assert method == 'GET' and headers['Range'] == 'bytes=0-1023'
+    finally:
+        scraper.close()
+
+
+def test_toongod_validate_keeps_page_order():
+    """Validation results come back in page order, whatever finishes first"""
+    scraper = ToonGodScraper()
+    delays = {'a': 0.2, 'b': 0.0, 'c': 0.1, 'd': 0.0}
+    scraper.test_image_url = lambda url, referer: time.sleep(delays[url]) or url != 'c'
+    try:
+        assert scraper.validate_urls_parallel(list('abcd'), referer=None) == ['a', 'b', 'd']
+    finally:
+        scraper.close()
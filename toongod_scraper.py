@@ -14,19 +14,32 @@ Features
 """
 
 import argparse
+import asyncio
+import itertools
 import logging
+import multiprocessing
 import os
 import re
+import shutil
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, UnicodeDammit
 from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, urlparse
 from urllib3.util.retry import Retry
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; _iter_chapter_anchors falls back to BeautifulSoup
+    etree = None
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +52,136 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared across calls
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+# manga_id sources on a series page, tried in order (postid-NNNN body class last)
+_MANGA_ID_RES = [
+    re.compile(r'"manga_id"\s*:\s*"(\d+)"', re.I),
+    re.compile(r"data-id=\"(\d+)\"", re.I),
+    re.compile(r"data-postid=\"(\d+)\"", re.I),
+]
+_POSTID_RE = re.compile(r'postid-(\d+)')
+# Chapter links: full chapter path, slug key (e.g. "12", "prologue") and numeric part
+_CHAPTER_HREF_RE = re.compile(r'/webtoon/[^/]+/chapter-[^/]+/?$')
+_CHAPTER_KEY_RE = re.compile(r'chapter-([\w-]+)')
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+)')
+_NUM_RE = re.compile(r'(\d+)')
+_SHOW_MORE_RE = re.compile(r"show more|more|expand|load more", re.I)
+_READER_CLASS_RE = re.compile(r'reading-content|chapter-content', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|name', re.I)
+# Only the DOM is needed from Playwright; skip pulling these through the browser
+_PW_BLOCKED_RESOURCES = frozenset({'image', 'media', 'font'})
+# Runs in the page: dedupe chapter anchors and keep only [href, text, slug key]
+_PW_CHAPTER_ANCHORS_JS = """els => {
+    const seen = new Set(), out = [];
+    for (const a of els) {
+        const h = a.getAttribute('href');
+        if (!h || seen.has(h)) continue;
+        seen.add(h);
+        const m = h.match(/chapter-([\\w-]+)/);
+        out.push([h, a.textContent.trim(), m ? m[1] : '']);
+    }
+    return out;
+}"""
+# Image extension anywhere in a URL (query strings allowed)
+_IMG_EXT_RE = re.compile(r'\.(?:jpe?g|png|webp|gif)', re.I)
+# Absolute image URLs anywhere in page markup (matched on the raw bytes)
+_IMG_URL_RE = re.compile(rb'https?://[^\s<>"\'{}|\\^`\[\]]*\.(?:jpg|jpeg|png|webp|gif)', re.I)
+
+
+def _make_soup(markup) -> BeautifulSoup:
+    # lxml builds the tree in C; fall back to html.parser if it isn't installed
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser')
+
+
+def _iter_chapter_anchors(html: bytes) -> Iterator[Tuple[str, str]]:
+    """Yield (href, text) for chapter anchors without building the whole DOM.
+
+    With lxml the page is stream-parsed and everything before each <a> is
+    dropped once read, so the tree never holds more than the current branch.
+    """
+    if etree is None:
+        for a in _make_soup(html).find_all('a', href=True):
+            if _CHAPTER_HREF_RE.search(a['href']):
+                yield a['href'], a.get_text(strip=True)
+        return
+    # libxml2 assumes latin-1 without a <meta charset>; sniff the way bs4 does
+    encoding = UnicodeDammit(html, is_html=True).original_encoding
+    for _, el in etree.iterparse(BytesIO(html), events=('end',), tag='a', html=True,
+                                 recover=True, encoding=encoding):
+        href = el.get('href')
+        if href and _CHAPTER_HREF_RE.search(href):
+            # Same joining as BeautifulSoup's get_text(strip=True)
+            yield href, ''.join(t.strip() for t in el.itertext())
+        el.clear(keep_tail=True)
+        for node in itertools.chain((el,), el.iterancestors()):
+            while node.getprevious() is not None:
+                del node.getparent()[0]
+
+
+def _is_image_url(url: str) -> bool:
+    # An http(s) scheme also rules out blob: and data: URLs
+    if not url or not url.startswith(('http://', 'https://')):
+        return False
+    if not _IMG_EXT_RE.search(url):
+        return False
+    try:
+        return bool(urlparse(url).netloc)
+    except ValueError:
+        return False
+
+
+def _parse_chapter_images(html: bytes) -> List[str]:
+    """Chapter page bytes -> image URLs in page order (pure CPU, picklable)."""
+    soup = _make_soup(html)
+    # Insertion-ordered dict doubles as the dedupe set
+    images: Dict[str, None] = {}
+    # Madara: images are usually within .reading-content img
+    container = soup.find(class_=_READER_CLASS_RE)
+    if not container:
+        container = soup
+    for img in container.find_all('img'):
+        for attr in ['data-src', 'data-original', 'data-lazy-src', 'src']:
+            src = img.get(attr)
+            if src and _is_image_url(src):
+                images.setdefault(src, None)
+                break
+    # Fallback: scan scripts/HTML for image URLs in the page as fetched, rather
+    # than reserializing the parsed tree
+    for m in _IMG_URL_RE.finditer(html):
+        u = m.group().decode('utf-8', 'replace')
+        if _is_image_url(u):
+            images.setdefault(u, None)
+    return list(images)
+
+
+def _chapter_sort_key(c: Dict[str, str]) -> int:
+    """Order chapters by their leading number, prologue first, unnumbered last."""
+    s = c['number'].lower()
+    if 'prologue' in s:
+        return -1
+    m = _NUM_RE.search(s)
+    return int(m.group(1)) if m else 10**9
+
+
+def _looks_like_image(head: bytes) -> bool:
+    """Sniff JPEG/PNG/GIF/WebP magic numbers from the first bytes of a body."""
+    return (
+        head.startswith((b'\xff\xd8\xff', b'\x89PNG', b'GIF8'))
+        or (head[:4] == b'RIFF' and head[8:12] == b'WEBP')
+    )
+
+
+def _is_cacheable_page(response) -> bool:
+    """HTTP-cache filter: pages only. Images are rejected by Content-Type or, when
+    the CDN sends a generic type, by an image extension on the URL path."""
+    if 'image' in response.headers.get('Content-Type', '').lower():
+        return False
+    return not _IMG_EXT_RE.search(urlparse(response.url).path)
+
 
 class ToonGodScraper:
     def __init__(
@@ -49,6 +192,12 @@ class ToonGodScraper:
         playwright_wait: float = 1.5,
         validate_urls: bool = False,
         max_workers: int = 6,
+        chapter_workers: Optional[int] = None,
+        async_io: bool = False,
+        async_concurrency: int = 32,
+        cache_dir: Optional[str] = None,
+        http2: bool = False,
+        parse_processes: int = 0,
     ) -> None:
         self.base_url = base_url.rstrip('/')
         self.download_dir = Path(download_dir)
@@ -56,8 +205,22 @@ class ToonGodScraper:
         self.playwright_wait = max(0.0, float(playwright_wait))
         self.validate_urls = validate_urls
         self.max_workers = max(1, int(max_workers))
+        # Chapters downloaded at once; each fans out to max_workers image downloads
+        if chapter_workers is None:
+            chapter_workers = max(2, self.max_workers // 2)
+        self.chapter_workers = max(1, int(chapter_workers))
+        # Optional aiohttp image path: one event loop per chapter instead of threads
+        self.async_io = async_io
+        self.async_concurrency = max(1, int(async_concurrency))
+        # Optional httpx image path: HTTP/2 multiplexes every chapter's images over
+        # a few connections. One AsyncClient lives on a background event loop.
+        self.http2 = http2
+        self._aloop: Optional[asyncio.AbstractEventLoop] = None
+        self._aloop_thread: Optional[threading.Thread] = None
+        self._aloop_lock = threading.Lock()
+        self._httpx_client = None
 
-        self.session = requests.Session()
+        self.session = self._make_session(cache_dir)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -69,18 +232,59 @@ class ToonGodScraper:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],
         )
-        adapter = HTTPAdapter(max_retries=retry, pool_connections=50, pool_maxsize=50)
+        # urllib3 already keeps one pool per host; size each so every concurrent
+        # chapter x image worker has a connection, and block rather than open
+        # throwaway connections when the pool is momentarily exhausted
+        pool_size = max(50, self.max_workers * self.chapter_workers * 2)
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
+        # One long-lived pool for validation and image downloads, sized so every
+        # concurrent chapter can still run max_workers requests
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Chapter pages are parsed in worker processes when set, so concurrent
+        # chapters are not serialized on the GIL
+        self.parse_processes = max(0, int(parse_processes))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Series URL -> manga_id (only successful lookups are remembered)
+        self._manga_ids: Dict[str, str] = {}
+
         # Playwright
         self.playwright = None
         self.playwright_browser = None
         self.playwright_context = None
+        # Single reused page; the sync API is not thread-safe, so page use is serialized
+        self._pw_page = None
+        self._pw_lock = threading.Lock()
+
+    @staticmethod
+    def _make_session(cache_dir: Optional[str]) -> requests.Session:
+        """Plain session, or an on-disk HTTP cache for pages when cache_dir is set."""
+        if not cache_dir:
+            return requests.Session()
+        try:
+            import requests_cache
+        except ImportError:
+            logger.warning("requests-cache is not installed (pip install requests-cache), pages will not be cached")
+            return requests.Session()
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        return requests_cache.CachedSession(
+            str(Path(cache_dir) / 'toongod_cache.sqlite'),
+            backend='sqlite',
+            expire_after=3600,
+            # POST covers the admin-ajax chapter list
+            allowable_methods=('GET', 'HEAD', 'POST'),
+            cache_control=True,
+            # Pages only: image bodies go straight to disk, never into the cache
+            filter_fn=_is_cacheable_page,
+        )
 
     # --------------- Utils ---------------
     def sanitize(self, s: str) -> str:
-        return re.sub(r'[<>:"/\\|?*]', '_', s).strip()
+        return _SANITIZE_RE.sub('_', s).strip()
 
     def mkdir(self, p: Path) -> None:
         p.mkdir(parents=True, exist_ok=True)
@@ -109,6 +313,7 @@ class ToonGodScraper:
             self.playwright_context = self.playwright_browser.new_context(
                 user_agent=self.session.headers.get('User-Agent')
             )
+            self.playwright_context.route('**/*', self._route_playwright_request)
         except Exception as e:
             logger.warning(f"Playwright init failed, disabling: {e}")
             self.use_playwright = False
@@ -131,8 +336,25 @@ class ToonGodScraper:
         except Exception:
             pass
 
+    @staticmethod
+    def _route_playwright_request(route) -> None:
+        if route.request.resource_type in _PW_BLOCKED_RESOURCES:
+            route.abort()
+        else:
+            route.continue_()
+
+    @contextmanager
+    def _leased_page(self) -> Iterator:
+        # Reuse one page instead of paying page/JS-context setup per URL
+        with self._pw_lock:
+            if self._pw_page is None or self._pw_page.is_closed():
+                self._pw_page = self.playwright_context.new_page()
+            yield self._pw_page
+
     def _close_playwright(self) -> None:
         try:
+            if self._pw_page is not None:
+                self._pw_page.close()
             if self.playwright_context is not None:
                 self.playwright_context.close()
             if self.playwright_browser is not None:
@@ -145,29 +367,118 @@ class ToonGodScraper:
             self.playwright = None
             self.playwright_browser = None
             self.playwright_context = None
+            self._pw_page = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers * self.chapter_workers, thread_name_prefix='toongod-io')
+            return self._pool
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the parser process pool (None when parsing inline)."""
+        if self.parse_processes <= 0:
+            return None
+        with self._pool_lock:
+            if self._parse_pool is None:
+                # spawn: forking a process that already runs worker threads is unsafe
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=multiprocessing.get_context('spawn'))
+            return self._parse_pool
+
+    def _parse(self, parser: Callable, html, *args):
+        """Run a module-level page parser, in a worker process when parse_processes is set."""
+        pool = self._get_parse_pool()
+        if pool is None:
+            return parser(html, *args)
+        try:
+            return pool.submit(parser, html, *args).result()
+        except BrokenProcessPool as e:
+            # A worker died (OOM, killed); stop using the pool rather than
+            # failing every later chapter
+            logger.warning(f"Parser process pool broke, parsing in-thread from now on: {e}")
+            with self._pool_lock:
+                if self._parse_pool is pool:
+                    self._parse_pool = None
+                    self.parse_processes = 0
+            pool.shutdown(wait=False)
+            return parser(html, *args)
+
+    def _run_bounded(self, fn: Callable, items: Iterable, limit: int) -> Iterator:
+        """Run fn over items on the shared pool with at most `limit` tasks in flight,
+        yielding results as they complete. Closing the generator cancels queued work.
+        """
+        pool = self._get_pool()
+        items = iter(items)
+        pending = {pool.submit(fn, item) for item in itertools.islice(items, limit)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    for item in itertools.islice(items, 1):
+                        pending.add(pool.submit(fn, item))
+                    yield fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+    def _get_async_loop(self) -> asyncio.AbstractEventLoop:
+        with self._aloop_lock:
+            if self._aloop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='toongod-http2', daemon=True)
+                thread.start()
+                self._aloop, self._aloop_thread = loop, thread
+            return self._aloop
+
+    def _run_async(self, coro):
+        """Run a coroutine on the shared background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_async_loop()).result()
+
+    def close(self) -> None:
+        """Release Playwright, the worker pools and the HTTP/2 client."""
+        self._close_playwright()
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+        with self._aloop_lock:
+            loop, self._aloop = self._aloop, None
+        if loop is not None:
+            if self._httpx_client is not None:
+                asyncio.run_coroutine_threadsafe(self._httpx_client.aclose(), loop).result()
+                self._httpx_client = None
+            loop.call_soon_threadsafe(loop.stop)
+            self._aloop_thread.join()
+            loop.close()
 
     # --------------- HTTP ---------------
     def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+        html = self._get_html(url)
+        return _make_soup(html) if html is not None else None
+
+    def _get_html(self, url: str) -> Optional[bytes]:
         # Try Playwright first if enabled
         if self.use_playwright:
             try:
                 self._init_playwright()
                 if self.playwright_context is not None:
-                    page = self.playwright_context.new_page()
-                    page.goto(url, wait_until='load', timeout=45000)
-                    if self.playwright_wait > 0:
-                        time.sleep(self.playwright_wait)
-                    html = page.content()
-                    page.close()
+                    with self._leased_page() as page:
+                        page.goto(url, wait_until='load', timeout=45000)
+                        if self.playwright_wait > 0:
+                            time.sleep(self.playwright_wait)
+                        html = page.content()
                     # sync cookies for subsequent requests
                     self._sync_cookies_from_playwright(url)
-                    return BeautifulSoup(html, 'html.parser')
+                    return html.encode('utf-8')
             except Exception as e:
                 logger.warning(f"Playwright fetch failed for {url}, falling back to requests: {e}")
         try:
             resp = self.session.get(url, timeout=30, headers={'Referer': self.base_url})
             resp.raise_for_status()
-            return BeautifulSoup(resp.content, 'html.parser')
+            return resp.content
         except Exception as e:
             logger.error(f"GET failed {url}: {e}")
             return None
@@ -178,12 +489,11 @@ class ToonGodScraper:
             try:
                 self._init_playwright()
                 if self.playwright_context is not None:
-                    page = self.playwright_context.new_page()
-                    page.goto(url, wait_until='load', timeout=45000)
-                    if self.playwright_wait > 0:
-                        time.sleep(self.playwright_wait)
-                    html = page.content()
-                    page.close()
+                    with self._leased_page() as page:
+                        page.goto(url, wait_until='load', timeout=45000)
+                        if self.playwright_wait > 0:
+                            time.sleep(self.playwright_wait)
+                        html = page.content()
                     self._sync_cookies_from_playwright(url)
                     return html
             except Exception as e:
@@ -212,36 +522,41 @@ class ToonGodScraper:
             logger.debug(f"Playwright POST failed {url}: {e}")
             return None
 
-    def _get_manga_id_from_series_page(self, series_url: str) -> Optional[str]:
-        html = self.get_page_text(series_url)
+    def _get_manga_id_from_series_page(self, series_url: str, series_html: Optional[bytes] = None) -> Optional[str]:
+        if series_url in self._manga_ids:
+            return self._manga_ids[series_url]
+        mid = self._find_manga_id(series_url, series_html)
+        if mid:
+            self._manga_ids[series_url] = mid
+        return mid
+
+    def _find_manga_id(self, series_url: str, series_html: Optional[bytes] = None) -> Optional[str]:
+        if series_html is not None:
+            html = series_html.decode('utf-8', 'replace')
+        else:
+            html = self.get_page_text(series_url)
         if not html:
             return None
         # Try several patterns
-        patterns = [
-            r'"manga_id"\s*:\s*"(\d+)"',
-            r"data-id=\"(\d+)\"",
-            r"data-postid=\"(\d+)\"",
-        ]
-        for pat in patterns:
-            m = re.search(pat, html, flags=re.I)
+        for pat in _MANGA_ID_RES:
+            m = pat.search(html)
             if m:
                 mid = m.group(1)
                 logger.debug(f"Extracted manga_id via pattern: {mid}")
                 return mid
         # Try body class like postid-8832
-        m = re.search(r'postid-(\d+)', html)
+        m = _POSTID_RE.search(html)
         if m:
             mid = m.group(1)
             logger.debug(f"Extracted manga_id via postid class: {mid}")
             return mid
         return None
 
-    def _fetch_chapters_via_ajax(self, series_url: str) -> List[Dict[str, str]]:
-        chapters: List[Dict[str, str]] = []
-        manga_id = self._get_manga_id_from_series_page(series_url)
+    def _fetch_chapters_via_ajax(self, series_url: str, series_html: Optional[bytes] = None) -> List[Dict[str, str]]:
+        manga_id = self._get_manga_id_from_series_page(series_url, series_html)
         if not manga_id:
             logger.debug("Could not extract manga_id from series page")
-            return chapters
+            return []
         logger.debug(f"Using manga_id={manga_id} for AJAX chapter fetch")
         ajax_url = urljoin(self.base_url + '/', 'wp-admin/admin-ajax.php')
         payload = {
@@ -264,25 +579,19 @@ class ToonGodScraper:
         if text is None and self.use_playwright and self.playwright_context is not None:
             text = self._ajax_post_playwright(ajax_url, payload, headers)
         if not text:
-            return chapters
-        # Parse returned HTML
-        soup = BeautifulSoup(text, 'html.parser')
+            return []
+        # Parse returned HTML; the dict dedupes by URL, first occurrence wins
+        soup = _make_soup(text)
+        by_url: Dict[str, Dict[str, str]] = {}
         for a in soup.find_all('a', href=True):
             href = a['href']
             if '/webtoon/' in href and '/chapter-' in href:
                 title = a.get_text(strip=True)
                 full = href if href.startswith('http') else urljoin(self.base_url, href)
-                m = re.search(r'chapter-([\w-]+)', href)
+                m = _CHAPTER_KEY_RE.search(href)
                 num_key = m.group(1) if m else title
-                chapters.append({'number': num_key, 'title': title, 'url': full})
-        # Deduplicate preserve order
-        seen = set()
-        uniq = []
-        for ch in chapters:
-            if ch['url'] not in seen:
-                seen.add(ch['url'])
-                uniq.append(ch)
-        return uniq
+                by_url.setdefault(full, {'number': num_key, 'title': title, 'url': full})
+        return list(by_url.values())
 
     def _fetch_chapters_via_playwright_dom(self, series_url: str) -> List[Dict[str, str]]:
         if not self.use_playwright:
@@ -291,62 +600,46 @@ class ToonGodScraper:
             self._init_playwright()
             if not self.playwright_context:
                 return []
-            page = self.playwright_context.new_page()
-            page.goto(series_url, wait_until='domcontentloaded', timeout=45000)
-            try:
-                page.wait_for_load_state('networkidle', timeout=10000)
-            except Exception:
-                pass
-            # Try small waits and scans with scroll to bottom to trigger lazy loads
-            total_wait = max(1.0, self.playwright_wait)
-            page.wait_for_timeout(int(total_wait * 1000))
-            # Attempt clicking any 'Show more' buttons
-            try:
-                buttons = page.locator("button, a").filter(has_text=re.compile(r"show more|more|expand|load more", re.I))
-                count = buttons.count()
-                for i in range(min(3, count)):
-                    try:
-                        buttons.nth(i).click(timeout=1000)
-                        page.wait_for_timeout(500)
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            # Scroll down a few times
-            for _ in range(5):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(400)
+            with self._leased_page() as page:
+                page.goto(series_url, wait_until='domcontentloaded', timeout=45000)
+                try:
+                    page.wait_for_load_state('networkidle', timeout=10000)
+                except Exception:
+                    pass
+                # Try small waits and scans with scroll to bottom to trigger lazy loads
+                total_wait = max(1.0, self.playwright_wait)
+                page.wait_for_timeout(int(total_wait * 1000))
+                # Attempt clicking any 'Show more' buttons
+                try:
+                    buttons = page.locator("button, a").filter(has_text=_SHOW_MORE_RE)
+                    count = buttons.count()
+                    for i in range(min(3, count)):
+                        try:
+                            buttons.nth(i).click(timeout=1000)
+                            page.wait_for_timeout(500)
+                        except Exception:
+                            continue
+                except Exception:
+                    pass
+                # Scroll down a few times
+                for _ in range(5):
+                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    page.wait_for_timeout(400)
 
-            # Wait for chapter anchors if they exist
-            try:
-                page.wait_for_selector("a[href*='/webtoon/'][href*='/chapter-']", timeout=15000)
-            except Exception:
-                pass
-            # Extract chapter anchors from DOM
-            anchors = page.eval_on_selector_all(
-                "a[href*='/webtoon/'][href*='/chapter-']",
-                "els => els.map(a => ({href: a.getAttribute('href'), text: a.textContent.trim()}))"
-            )
-            page.close()
-            chapters: List[Dict[str, str]] = []
-            if anchors:
-                for a in anchors:
-                    href = a.get('href') or ''
-                    if not href:
-                        continue
-                    title = a.get('text', '').strip()
-                    full = href if href.startswith('http') else urljoin(self.base_url, href)
-                    m = re.search(r"chapter-([\w-]+)", href)
-                    num_key = m.group(1) if m else title
-                    chapters.append({'number': num_key, 'title': title, 'url': full})
-            # Dedup preserve order
-            seen = set()
-            uniq = []
-            for ch in chapters:
-                if ch['url'] not in seen:
-                    seen.add(ch['url'])
-                    uniq.append(ch)
-            return uniq
+                # Wait for chapter anchors if they exist
+                try:
+                    page.wait_for_selector("a[href*='/webtoon/'][href*='/chapter-']", timeout=15000)
+                except Exception:
+                    pass
+                # Extract chapter anchors from DOM in one round-trip, deduped by
+                # href in the page and packed as [href, text, key] tuples
+                anchors = page.eval_on_selector_all("a[href*='/webtoon/'][href*='/chapter-']", _PW_CHAPTER_ANCHORS_JS)
+            # Relative and absolute hrefs can still resolve to the same URL
+            by_url: Dict[str, Dict[str, str]] = {}
+            for href, title, key in anchors or []:
+                full = href if href.startswith('http') else urljoin(self.base_url, href)
+                by_url.setdefault(full, {'number': key or title, 'title': title, 'url': full})
+            return list(by_url.values())
         except Exception as e:
             logger.debug(f"Playwright DOM extraction failed: {e}")
             return []
@@ -358,28 +651,27 @@ class ToonGodScraper:
             self._init_playwright()
             if not self.playwright_context:
                 return []
-            page = self.playwright_context.new_page()
-            page.goto(series_url, wait_until='domcontentloaded', timeout=45000)
-            try:
-                page.wait_for_load_state('networkidle', timeout=8000)
-            except Exception:
-                pass
-            # Try to find Read Last link
-            last_href = None
-            try:
-                last_href = page.eval_on_selector("a:has-text('Read Last')", "a => a && a.getAttribute('href')")
-            except Exception:
-                pass
-            if not last_href:
-                # Try alternative text casing or language neutral approach
+            with self._leased_page() as page:
+                page.goto(series_url, wait_until='domcontentloaded', timeout=45000)
                 try:
-                    last_href = page.eval_on_selector("a[href*='/chapter-']:nth-of-type(1)", "a => a && a.getAttribute('href')")
+                    page.wait_for_load_state('networkidle', timeout=8000)
                 except Exception:
                     pass
-            page.close()
+                # Try to find Read Last link
+                last_href = None
+                try:
+                    last_href = page.eval_on_selector("a:has-text('Read Last')", "a => a && a.getAttribute('href')")
+                except Exception:
+                    pass
+                if not last_href:
+                    # Try alternative text casing or language neutral approach
+                    try:
+                        last_href = page.eval_on_selector("a[href*='/chapter-']:nth-of-type(1)", "a => a && a.getAttribute('href')")
+                    except Exception:
+                        pass
             if not last_href:
                 return []
-            m = re.search(r"chapter-(\d+)", last_href)
+            m = _CHAPTER_NUM_RE.search(last_href)
             if not m:
                 return []
             last_num = int(m.group(1))
@@ -394,22 +686,15 @@ class ToonGodScraper:
             return []
 
     # --------------- Extraction ---------------
-    def extract_chapters(self, series_url: str) -> List[Dict[str, str]]:
+    def extract_chapters(self, series_url: str, series_html: Optional[bytes] = None) -> List[Dict[str, str]]:
+        """List a series' chapters; series_html, when the caller already fetched
+        the series page, is reused instead of downloading it again.
+        """
         # First, try Playwright DOM extraction if enabled
         chapters = self._fetch_chapters_via_playwright_dom(series_url)
         if chapters:
             logger.info(f"Found {len(chapters)} chapters via DOM")
-            # Sort chapters as before
-            def sort_key_dom(c: Dict[str, str]):
-                s = c['number'].lower()
-                if 'prologue' in s:
-                    return -1
-                try:
-                    m = re.search(r'(\d+)', s)
-                    return int(m.group(1)) if m else 10**9
-                except Exception:
-                    return 10**9
-            chapters = sorted(chapters, key=sort_key_dom)
+            chapters = sorted(chapters, key=_chapter_sort_key)
             return chapters
 
         # Next, try deriving from "Read Last" link (range-based)
@@ -419,105 +704,39 @@ class ToonGodScraper:
             return chapters
 
         # Next, try Madara AJAX endpoint (most reliable when accessible)
-        chapters = self._fetch_chapters_via_ajax(series_url)
+        chapters = self._fetch_chapters_via_ajax(series_url, series_html)
         if chapters:
-            # Sort chapters as before
-            def sort_key(c: Dict[str, str]):
-                s = c['number'].lower()
-                if 'prologue' in s:
-                    return -1
-                try:
-                    m = re.search(r'(\d+)', s)
-                    return int(m.group(1)) if m else 10**9
-                except Exception:
-                    return 10**9
-            chapters = sorted(chapters, key=sort_key)
+            chapters = sorted(chapters, key=_chapter_sort_key)
             logger.info(f"Found {len(chapters)} chapters")
             return chapters
 
         # Fallback: parse directly from series page anchors
-        soup = self.get_soup(series_url)
-        if not soup:
+        html = series_html if series_html is not None else self._get_html(series_url)
+        if not html:
             return []
-        chapters = []
-        # Madara theme: chapter list anchors contain '/chapter-'
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            if re.search(r'/webtoon/[^/]+/chapter-[^/]+/?$', href):
-                title = a.get_text(strip=True)
-                full = href if href.startswith('http') else urljoin(self.base_url, href)
-                # Try extract number for sorting
-                m = re.search(r'chapter-([\w-]+)', href)
-                num_key = m.group(1) if m else title
-                chapters.append({'number': num_key, 'title': title, 'url': full})
+        # Madara theme: chapter list anchors contain '/chapter-'.
         # Deduplicate by URL and keep order (the page lists recent first)
-        seen = set()
-        uniq = []
-        for ch in chapters:
-            if ch['url'] not in seen:
-                seen.add(ch['url'])
-                uniq.append(ch)
+        by_url: Dict[str, Dict[str, str]] = {}
+        for href, title in _iter_chapter_anchors(html):
+            full = href if href.startswith('http') else urljoin(self.base_url, href)
+            # Try extract number for sorting
+            m = _CHAPTER_KEY_RE.search(href)
+            num_key = m.group(1) if m else title
+            by_url.setdefault(full, {'number': num_key, 'title': title, 'url': full})
+        uniq = list(by_url.values())
         # Sort by numeric when possible, else lexicographically, but ensure prologue (0) first
-        def sort_key(c: Dict[str, str]):
-            s = c['number'].lower()
-            if 'prologue' in s:
-                return -1
-            try:
-                # Take only leading integer if present
-                m = re.search(r'(\d+)', s)
-                return int(m.group(1)) if m else 10**9
-            except Exception:
-                return 10**9
-        uniq_sorted = sorted(uniq, key=sort_key)
+        uniq_sorted = sorted(uniq, key=_chapter_sort_key)
         logger.info(f"Found {len(uniq_sorted)} chapters")
         return uniq_sorted
 
     def _is_valid_image_url(self, url: str) -> bool:
-        if not url or not isinstance(url, str):
-            return False
-        if url.startswith('blob:') or url.startswith('data:'):
-            return False
-        if not url.startswith('http'):
-            return False
-        url_l = url.lower()
-        if not any(ext in url_l for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']):
-            return False
-        try:
-            return bool(urlparse(url).netloc)
-        except Exception:
-            return False
+        return _is_image_url(url)
 
     def extract_images_from_chapter(self, chapter_url: str) -> List[str]:
-        soup = self.get_soup(chapter_url)
-        if not soup:
+        html = self._get_html(chapter_url)
+        if not html:
             return []
-        images: List[str] = []
-        # Madara: images are usually within .reading-content img
-        container = soup.find(class_=re.compile(r'reading-content|chapter-content', re.I))
-        if not container:
-            container = soup
-        for img in container.find_all('img'):
-            for attr in ['data-src', 'data-original', 'data-lazy-src', 'src']:
-                src = img.get(attr)
-                if src and self._is_valid_image_url(src):
-                    images.append(src)
-                    break
-        # Fallback: scan scripts/HTML for image URLs
-        page_text = str(soup)
-        patterns = [
-            r'https?://[^\s<>"\'{}|\\^`\[\]]*\.(?:jpg|jpeg|png|webp|gif)'
-        ]
-        for pat in patterns:
-            for u in re.findall(pat, page_text, flags=re.I):
-                if self._is_valid_image_url(u):
-                    images.append(u)
-        # Deduplicate while preserving order
-        seen = set()
-        ordered = []
-        for u in images:
-            if u not in seen:
-                seen.add(u)
-                ordered.append(u)
+        ordered = self._parse(_parse_chapter_images, html)
         # Limit
         if len(ordered) > 200:
             logger.warning(f"Found {len(ordered)} images, limiting to first 200")
@@ -527,37 +746,19 @@ class ToonGodScraper:
 
     # --------------- Network helpers ---------------
     def test_image_url(self, url: str, referer: Optional[str]) -> bool:
+        # One ranged GET instead of HEAD + GET: CDNs often penalize HEAD, and a
+        # 206 carries just enough body to sniff when content-type is missing/odd
         headers = self._build_img_headers(referer)
-        head_resp = None
+        headers['Range'] = 'bytes=0-1023'
         try:
-            head_resp = self.session.head(url, timeout=6, allow_redirects=True, headers=headers)
-            if head_resp.status_code == 200:
-                ctype = head_resp.headers.get('content-type', '').lower()
-                if (not ctype) or ('image' in ctype):
+            with self.session.get(url, timeout=6, stream=True, headers=headers) as r:
+                if r.status_code not in (200, 206):
+                    return False
+                if 'image' in r.headers.get('content-type', '').lower():
                     return True
+                return _looks_like_image(next(r.iter_content(chunk_size=16), b''))
         except Exception:
-            pass
-        finally:
-            try:
-                if head_resp is not None:
-                    head_resp.close()
-            except Exception:
-                pass
-        # GET fallback
-        try:
-            with self.session.get(url, timeout=10, stream=True, headers=headers) as r:
-                if r.status_code == 200:
-                    ctype = r.headers.get('content-type', '').lower()
-                    if (not ctype) or ('image' in ctype):
-                        # read a tiny chunk
-                        try:
-                            next(r.iter_content(chunk_size=512))
-                        except StopIteration:
-                            pass
-                        return True
-        except Exception:
-            pass
-        return False
+            return False
 
     def _download_with_playwright(self, url: str, filepath: Path, headers: Dict[str, str]) -> bool:
         try:
@@ -577,6 +778,18 @@ class ToonGodScraper:
         except Exception:
             return False
 
+    @staticmethod
+    def _preallocate(f, r: requests.Response) -> None:
+        # Reserve the final size up front when it is known (Content-Length is the
+        # encoded size, so only for identity bodies); purely a fragmentation hint
+        length = r.headers.get('Content-Length')
+        if not length or r.headers.get('Content-Encoding') or not hasattr(os, 'posix_fallocate'):
+            return
+        try:
+            os.posix_fallocate(f.fileno(), 0, int(length))
+        except (OSError, ValueError):
+            pass
+
     def download_image(self, url: str, filepath: Path, referer: Optional[str]) -> bool:
         headers = self._build_img_headers(referer)
         try:
@@ -585,10 +798,11 @@ class ToonGodScraper:
                     return True
             with self.session.get(url, timeout=20, stream=True, headers=headers) as r:
                 r.raise_for_status()
+                # Copy straight from the socket in 64 KiB blocks instead of 8 KiB Python chunks
+                r.raw.decode_content = True
                 with open(filepath, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    self._preallocate(f, r)
+                    shutil.copyfileobj(r.raw, f, length=1 << 16)
             return True
         except Exception as e:
             logger.warning(f"Download failed {url}: {e}")
@@ -597,25 +811,110 @@ class ToonGodScraper:
     def validate_urls_parallel(self, urls: List[str], referer: Optional[str]) -> List[str]:
         if not urls:
             return []
-        def check(u: str):
-            return u, self.test_image_url(u, referer)
+        def check(iu):
+            i, u = iu
+            return i, u, self.test_image_url(u, referer)
         workers = max(1, min(self.max_workers, len(urls)))
-        valid: List[str] = []
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = [ex.submit(check, u) for u in urls]
-            for fut in as_completed(futs):
-                u, ok = fut.result()
-                if ok:
-                    valid.append(u)
-        return valid
+        # Results arrive in completion order; sort by index to keep page order
+        return [u for _, u, ok in sorted(self._run_bounded(check, enumerate(urls), workers)) if ok]
+
+    async def _download_images_async(self, indices, chapter_dir: Path, referer: Optional[str], existing: Set[str]) -> int:
+        """Download a chapter's images concurrently on one event loop; returns the success count."""
+        import aiohttp
+        headers = self._build_img_headers(referer)
+        headers.setdefault('User-Agent', self.session.headers.get('User-Agent'))
+        semaphore = asyncio.Semaphore(self.async_concurrency)
+
+        async def fetch(client, i: int, u: str) -> bool:
+            fname = f"page_{i:03d}.jpg"
+            if fname in existing:
+                return True
+            fpath = chapter_dir / fname
+            request_headers = dict(headers)
+            # Send the same cookies requests would (incl. those synced from Playwright)
+            cookie = requests.cookies.get_cookie_header(self.session.cookies, requests.Request('GET', u))
+            if cookie:
+                request_headers['Cookie'] = cookie
+            async with semaphore:
+                # Same policy as the threaded path: one retry after a short pause
+                for attempt in range(2):
+                    try:
+                        async with client.get(u, headers=request_headers) as r:
+                            r.raise_for_status()
+                            with open(fpath, 'wb') as f:
+                                async for chunk in r.content.iter_chunked(1 << 16):
+                                    f.write(chunk)
+                        return True
+                    except Exception as e:
+                        if attempt == 0:
+                            await asyncio.sleep(0.3)
+                        else:
+                            logger.warning(f"Download failed {u}: {e}")
+            return False
+
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=32)
+        timeout = aiohttp.ClientTimeout(total=30, sock_read=20)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as client:
+            results = await asyncio.gather(*(fetch(client, i, u) for i, u in indices))
+        return sum(1 for ok in results if ok)
+
+    async def _download_images_httpx(self, indices, chapter_dir: Path, referer: Optional[str], existing: Set[str]) -> int:
+        """HTTP/2 variant of _download_images_async on the shared httpx client."""
+        import httpx
+        # Only touched from the background loop's thread, so no lock is needed
+        if self._httpx_client is None:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(30, read=20),
+                follow_redirects=True,
+            )
+        client = self._httpx_client
+        headers = self._build_img_headers(referer)
+        headers.setdefault('User-Agent', self.session.headers.get('User-Agent'))
+        semaphore = asyncio.Semaphore(self.async_concurrency)
+
+        async def fetch(i: int, u: str) -> bool:
+            fname = f"page_{i:03d}.jpg"
+            if fname in existing:
+                return True
+            fpath = chapter_dir / fname
+            request_headers = dict(headers)
+            # Send the same cookies requests would (incl. those synced from Playwright)
+            cookie = requests.cookies.get_cookie_header(self.session.cookies, requests.Request('GET', u))
+            if cookie:
+                request_headers['Cookie'] = cookie
+            async with semaphore:
+                # Same policy as the threaded path: one retry after a short pause
+                for attempt in range(2):
+                    try:
+                        async with client.stream('GET', u, headers=request_headers) as r:
+                            r.raise_for_status()
+                            with open(fpath, 'wb') as f:
+                                async for chunk in r.aiter_bytes(1 << 16):
+                                    f.write(chunk)
+                        return True
+                    except Exception as e:
+                        if attempt == 0:
+                            await asyncio.sleep(0.3)
+                        else:
+                            logger.warning(f"Download failed {u}: {e}")
+            return False
+
+        results = await asyncio.gather(*(fetch(i, u) for i, u in indices))
+        return sum(1 for ok in results if ok)
 
     # --------------- Download flow ---------------
-    def download_chapter(self, series_title: str, chapter: Dict[str, str], delay: float) -> bool:
+    def download_chapter(self, series_title: str, chapter: Dict[str, str], delay: float, imgs: Optional[List[str]] = None) -> bool:
         title_safe = self.sanitize(chapter['title'] or f"Chapter_{chapter['number']}")
         chapter_dir = self.download_dir / self.sanitize(series_title) / f"{self.sanitize(chapter['number'])}_{title_safe}"
         self.mkdir(chapter_dir)
+        # One directory read up front instead of a stat() per page
+        with os.scandir(chapter_dir) as entries:
+            existing = {e.name for e in entries}
         logger.info(f"Downloading chapter {chapter['number']}: {chapter['title']}")
-        imgs = self.extract_images_from_chapter(chapter['url'])
+        if imgs is None:
+            imgs = self.extract_images_from_chapter(chapter['url'])
         if not imgs:
             logger.warning("No images found in chapter")
             return False
@@ -625,52 +924,114 @@ class ToonGodScraper:
             if not imgs:
                 logger.warning("No valid images after validation")
                 return False
+        indices = list(enumerate(imgs, 1))
+        if self.http2 and not self.use_playwright:
+            try:
+                import h2  # noqa: F401
+                import httpx  # noqa: F401
+            except ImportError:
+                logger.warning("httpx[http2] is not installed (pip install 'httpx[http2]'), falling back")
+                self.http2 = False
+            else:
+                logger.info(f"Downloading {len(imgs)} images over HTTP/2, concurrency={self.async_concurrency}")
+                success = self._run_async(self._download_images_httpx(indices, chapter_dir, chapter['url'], existing))
+                logger.info(f"Downloaded {success}/{len(imgs)} images for chapter {chapter['number']}")
+                return success > 0
+        if self.async_io and not self.use_playwright:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError:
+                logger.warning("aiohttp is not installed (pip install aiohttp), falling back to threaded downloads")
+                self.async_io = False
+            else:
+                logger.info(f"Downloading {len(imgs)} images with asyncio, concurrency={self.async_concurrency}")
+                success = asyncio.run(self._download_images_async(indices, chapter_dir, chapter['url'], existing))
+                logger.info(f"Downloaded {success}/{len(imgs)} images for chapter {chapter['number']}")
+                return success > 0
         # concurrency
         workers = max(1, min(self.max_workers, len(imgs)))
         if self.use_playwright:
             workers = min(workers, 2)
         logger.info(f"Downloading {len(imgs)} images with concurrency={workers}")
-        success = 0
         def download_one(iu):
             i, u = iu
             fname = f"page_{i:03d}.jpg"
-            fpath = chapter_dir / fname
-            if fpath.exists():
+            if fname in existing:
                 return True
+            fpath = chapter_dir / fname
             ok = self.download_image(u, fpath, referer=chapter['url'])
             if not ok:
                 time.sleep(0.3)
                 ok = self.download_image(u, fpath, referer=chapter['url'])
             return ok
-        indices = list(enumerate(imgs, 1))
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = [ex.submit(download_one, iu) for iu in indices]
-            for fut in as_completed(futs):
-                if fut.result():
-                    success += 1
+        success = sum(1 for ok in self._run_bounded(download_one, indices, workers) if ok)
         logger.info(f"Downloaded {success}/{len(imgs)} images for chapter {chapter['number']}")
         return success > 0
 
     def download_series(self, series_url: str, delay: float) -> None:
-        # Figure out series title from page
-        soup = self.get_soup(series_url)
+        # Figure out series title from page; the same bytes feed chapter extraction
+        html = self._get_html(series_url)
         series_title = "Series"
-        if soup:
-            h1 = soup.find(['h1', 'h2'], class_=re.compile(r'title|name', re.I)) or soup.find(['h1', 'h2'])
+        if html:
+            soup = _make_soup(html)
+            h1 = soup.find(['h1', 'h2'], class_=_TITLE_CLASS_RE) or soup.find(['h1', 'h2'])
             if h1:
                 series_title = self.sanitize(h1.get_text(strip=True)) or series_title
-        chapters = self.extract_chapters(series_url)
+        chapters = self.extract_chapters(series_url, series_html=html)
         if not chapters:
             logger.error("No chapters found")
             return
-        for ch in chapters:
-            try:
-                self.download_chapter(series_title, ch, delay)
-                time.sleep(delay)
-            except Exception as e:
-                logger.error(f"Error downloading chapter {ch['number']}: {e}")
+
+        # Chapters are independent I/O, so overlap a few; all workers share the
+        # session's keep-alive pool. Sync Playwright objects only work on the
+        # thread that created them, so with Playwright chapters run serially here.
+        workers = 1 if self.use_playwright else min(self.chapter_workers, len(chapters))
+
+        # While a worker downloads chapter i's images, fetch and parse the page of
+        # chapter i + workers (the next one a free worker will pick up). Skipped
+        # under Playwright, whose page must stay on the thread that created it.
+        prefetch = None if self.use_playwright else ThreadPoolExecutor(max_workers=workers, thread_name_prefix='toongod-prefetch')
+        pending: Dict[int, Future] = {}
+        pending_lock = threading.Lock()
+
+        def run(i: int) -> bool:
+            ch = chapters[i]
+            with pending_lock:
+                fut = pending.pop(i, None)
+                if prefetch is not None and i + workers < len(chapters):
+                    nxt = chapters[i + workers]['url']
+                    pending[i + workers] = prefetch.submit(self.extract_images_from_chapter, nxt)
+            imgs = None
+            if fut is not None:
+                try:
+                    imgs = fut.result()
+                except Exception as e:
+                    logger.debug(f"Prefetch failed for chapter {ch['number']}, refetching: {e}")
+            ok = self.download_chapter(series_title, ch, delay, imgs=imgs)
+            # Pace each worker between chapters
+            time.sleep(delay)
+            return ok
+
+        try:
+            if self.use_playwright:
+                for i, ch in enumerate(chapters):
+                    try:
+                        run(i)
+                    except Exception as e:
+                        logger.error(f"Error downloading chapter {ch['number']}: {e}")
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    futs = {ex.submit(run, i): ch for i, ch in enumerate(chapters)}
+                    for fut in as_completed(futs):
+                        try:
+                            fut.result()
+                        except Exception as e:
+                            logger.error(f"Error downloading chapter {futs[fut]['number']}: {e}")
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=True, cancel_futures=True)
         # Cleanup
-        self._close_playwright()
+        self.close()
 
 
 def main() -> None:
@@ -682,6 +1043,12 @@ def main() -> None:
     parser.add_argument('--pw-wait', type=float, default=1.5, help='Wait time after Playwright load (seconds)')
     parser.add_argument('--validate-urls', action='store_true', help='Validate image URLs before downloading')
     parser.add_argument('--max-workers', type=int, default=6, help='Max concurrency for validation/downloads')
+    parser.add_argument('--async-io', action='store_true', help='Download chapter images with asyncio + aiohttp instead of threads')
+    parser.add_argument('--async-concurrency', type=int, default=32, help='Max in-flight image requests per chapter with --async-io/--http2')
+    parser.add_argument('--parse-processes', type=int, default=0, help='Parse chapter pages in this many worker processes (0 parses in-thread)')
+    parser.add_argument('--http2', action='store_true', help='Download chapter images over HTTP/2 with httpx (requires httpx[http2])')
+    parser.add_argument('--cache-dir', default=None, help='Cache series/chapter pages on disk here (requires requests-cache)')
+    parser.add_argument('--chapter-workers', type=int, default=None, help='Chapters downloaded concurrently (default: max-workers / 2, at least 2)')
     args = parser.parse_args()
 
     scraper = ToonGodScraper(
@@ -691,6 +1058,12 @@ def main() -> None:
         playwright_wait=args.pw_wait,
         validate_urls=args.validate_urls,
         max_workers=args.max_workers,
+        chapter_workers=args.chapter_workers,
+        async_io=args.async_io,
+        async_concurrency=args.async_concurrency,
+        cache_dir=args.cache_dir,
+        http2=args.http2,
+        parse_processes=args.parse_processes,
     )
     scraper.download_series(args.url, delay=args.delay)
     logger.info('Done!')